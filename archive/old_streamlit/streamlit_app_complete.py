@@ -8,10 +8,29 @@ import json
 import sys
 import os
 import re
-import copy
 from pathlib import Path
 import hashlib
 from datetime import datetime
+from functools import lru_cache
+
+# google-re2 gives linear-time DFA matching; the third-party regex module is
+# the next choice, and stdlib re the fallback. The first two only run on ASCII
+# text (see _IgnoreCasePattern)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+# orjson is a much faster C implementation of the JSON paths; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -117,7 +136,7 @@ ALL_BIAS_WORDS = []
 for category_words in BIAS_WORDS.values():
     ALL_BIAS_WORDS.extend(category_words)
 
-# PII patterns
+# PII patterns, applied one after another in this order
 PII_PATTERNS = {
     'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
     'phone': r'(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
@@ -129,6 +148,90 @@ PII_PATTERNS = {
     'driver_license': r'\b[A-Z]{1,2}\d{5,8}\b'
 }
 
+# Common first/last names stripped from name-like fields
+COMMON_NAMES = [
+    'john', 'jane', 'smith', 'garcia', 'chen', 'williams', 'johnson',
+    'brown', 'jones', 'miller', 'davis', 'wilson', 'anderson', 'taylor',
+    'thomas', 'jackson', 'martin', 'lee', 'thompson', 'white', 'harris',
+    'clark', 'lewis', 'robinson', 'walker', 'hall', 'allen', 'king'
+]
+
+
+
+# re's \s also matches \v and \x1c-\x1f, which re2's and regex's do not;
+# spelled out for the character classes of PII_PATTERNS, the only place \s
+# appears
+_ASCII_WHITESPACE = r'\t-\r\x1c- '
+
+
+class _IgnoreCasePattern:
+    """
+    Case-insensitive pattern that runs on re2 or regex for ASCII text.
+    
+    re2's \\b, \\w and \\d only know ASCII, and regex folds case and draws
+    word boundaries differently from re on some other text (dotless i,
+    combining marks, superscript digits). Non-ASCII text therefore always
+    goes through stdlib re, keeping the output independent of which engines
+    are installed.
+    """
+    
+    def __init__(self, pattern):
+        self._pattern = re.compile(pattern, re.IGNORECASE)
+        self._ascii_pattern = self._pattern
+        ascii_pattern = pattern.replace(r'\s', _ASCII_WHITESPACE)
+        if re2 is not None:
+            try:
+                self._ascii_pattern = re2.compile('(?i)' + ascii_pattern)
+                return
+            except re2.error:
+                pass
+        if regex is not None:
+            self._ascii_pattern = regex.compile(ascii_pattern, regex.IGNORECASE)
+    
+    def sub(self, repl, text):
+        """Same as re.Pattern.sub."""
+        return self.subn(repl, text)[0]
+    
+    def subn(self, repl, text):
+        """Same as re.Pattern.subn."""
+        if text.isascii():
+            return self._ascii_pattern.subn(repl, text)
+        return self._pattern.subn(repl, text)
+
+
+# Precompile patterns once at import instead of on every call.
+# The PII patterns run one at a time, each with its placeholder: a single
+# alternation lets one match swallow the start of the next piece of PII
+_PII_PASSES = tuple(
+    (_IgnoreCasePattern(pattern), f"[{pii_type.upper().replace('_', '-')}]")
+    for pii_type, pattern in PII_PATTERNS.items()
+)
+
+# Every PII pattern needs a digit or an '@', so text without either is skipped
+_PII_CANDIDATE_RE = re.compile(r'[\d@]')
+
+# One alternation for all bias words, longest first so phrases such as
+# "baby boomer" win over their shorter components
+_BIAS_UNION = _IgnoreCasePattern(
+    r'\b(?:' + '|'.join(
+        re.escape(word) for word in sorted(set(ALL_BIAS_WORDS), key=lambda w: (-len(w), w))
+    ) + r')s?\b'
+)
+_COMMON_NAMES_UNION = re.compile(
+    r'\b(?:' + '|'.join(COMMON_NAMES) + r')\b',
+    re.IGNORECASE
+)
+
+# Leftover punctuation cleanup in one pass: doubled dashes, doubled commas
+# and a trailing colon
+_CLEANUP_RE = re.compile(r'(\s*-\s*-\s*)|(\s*,\s*,\s*)|(\s*:\s*$)')
+_CLEANUP_REPLACEMENTS = (None, ' - ', ', ', '')
+
+
+def _cleanup_replacement(match):
+    """Replacement for whichever _CLEANUP_RE group matched."""
+    return _CLEANUP_REPLACEMENTS[match.lastindex]
+
 # Fields that might contain PII (names, locations, etc.)
 PII_FIELDS = {
     'names': ['name', 'firstname', 'lastname', 'fullname', 'username', 'createdby', 
@@ -141,6 +244,50 @@ PII_FIELDS = {
                  'medical', 'health', 'diagnosis', 'medication', 'treatment']
 }
 
+# Fields (lowercased) that should be completely removed
+_REMOVE_FIELDS = frozenset({
+    'createdby', 'modifiedby', 'lastmodifiedby', 'approvedby',
+    'updatedby', 'deletedby', 'email', 'emailaddress', 'phone',
+    'phonenumber', 'mobile', 'socialmedia', 'linkedin', 'twitter',
+    'facebook', 'personalwebsite'
+})
+
+# Fields (lowercased) whose values should be hashed
+_HASH_FIELDS = frozenset({'userid', 'employeeid', 'personid', 'candidateid', 'applicantid'})
+
+# Fields to preserve (don't anonymize)
+_PRESERVE_FIELDS = frozenset({
+    "code", "id", "jobCode", "externalSourceType",
+    "completionYear", "degree", "areaOfStudy", "certifications",
+    "crossDivisionalExperience", "internationalExperience",
+    "timeInCurrentRoleInDays", "version", "completionScore",
+    "businessDivisionCode", "businessUnitCode", "boardType",
+    "membershipType", "educationType", "certificationLevel"
+})
+
+# Substrings marking a field as holding a person/organization name or title
+_NAMEISH_FIELDS = ('name', 'title', 'organization', 'institution', 'company')
+_NAMEISH_RE = re.compile('|'.join(_NAMEISH_FIELDS))
+
+# Substrings marking a field as holding a date or time
+_DATETIME_RE = re.compile('date|time')
+
+
+def _loads_json(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, compact or with a 2-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
 
 def remove_pii_from_text(text):
     """
@@ -155,14 +302,18 @@ def remove_pii_from_text(text):
     if not text or not isinstance(text, str):
         return text
     
-    result = text
-    
-    # Remove PII patterns
-    for pii_type, pattern in PII_PATTERNS.items():
-        replacement = f"[{pii_type.upper().replace('_', '-')}]"
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    # Most fields hold no digits or '@' and can't contain PII
+    if not _PII_CANDIDATE_RE.search(text):
+        return text
     
-    return result
+    return _remove_pii_patterns(text)
+
+
+def _remove_pii_patterns(text):
+    """Replace PII in text, one pattern at a time."""
+    for pattern, replacement in _PII_PASSES:
+        text = pattern.sub(replacement, text)
+    return text
 
 
 def remove_bias_from_text(text):
@@ -178,19 +329,15 @@ def remove_bias_from_text(text):
     if not text or not isinstance(text, str):
         return text
     
-    result = text
-    
     # Remove each bias word (case-insensitive)
-    for word in ALL_BIAS_WORDS:
-        # Use word boundaries for accurate matching
-        pattern = r'\b' + re.escape(word) + r's?\b'
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-    
-    # Clean up extra spaces
-    result = re.sub(r'\s+', ' ', result).strip()
-    result = re.sub(r'\s*-\s*-\s*', ' - ', result)
-    result = re.sub(r'\s*,\s*,\s*', ', ', result)
-    result = re.sub(r'\s*:\s*$', '', result)
+    return _tidy_bias_removal(_BIAS_UNION.sub('', text), text)
+
+
+def _tidy_bias_removal(result, text):
+    """Clean up what is left of text after its bias words were removed."""
+    # Clean up extra spaces and leftover punctuation
+    result = _CLEANUP_RE.sub(_cleanup_replacement, result)
+    result = ' '.join(result.split())
     
     # Return placeholder if string became empty
     if not result and len(text) > 5:
@@ -220,6 +367,15 @@ def anonymize_date(date_str):
     return "[YEAR]"
 
 
+@lru_cache(maxsize=4096)
+def _hash_identifier_text(identifier_text):
+    """Hash the string form of an identifier; memoized since ids repeat across profiles."""
+    # Only a short well-distributed digest is needed; blake2s with a 4-byte
+    # digest (8 hex chars) is cheaper than truncating SHA-256
+    hashed = hashlib.blake2s(identifier_text.encode(), digest_size=4).hexdigest().upper()
+    return f"ID_{hashed}"
+
+
 def hash_identifier(identifier):
     """
     Hash an identifier to maintain uniqueness but remove actual value.
@@ -233,50 +389,99 @@ def hash_identifier(identifier):
     if not identifier:
         return identifier
     
-    # Create a hash
-    hashed = hashlib.sha256(str(identifier).encode()).hexdigest()[:8].upper()
-    return f"ID_{hashed}"
+    # Create a hash (str() first so any identifier type hits the cache)
+    return _hash_identifier_text(str(identifier))
 
 
-def should_remove_field(field_name):
+def anonymize_text_field(value, field_lower):
     """
-    Check if a field should be completely removed.
+    Remove PII and bias from a free-text string value.
     
     Args:
-        field_name: Field name
+        value: String value
+        field_lower: Lowercased name of the field holding the value
         
     Returns:
-        Boolean indicating if field should be removed
+        Anonymized string
     """
-    field_lower = field_name.lower()
-    
-    # Fields that should be completely removed
-    remove_fields = [
-        'createdby', 'modifiedby', 'lastmodifiedby', 'approvedby',
-        'updatedby', 'deletedby', 'email', 'emailaddress', 'phone',
-        'phonenumber', 'mobile', 'socialmedia', 'linkedin', 'twitter',
-        'facebook', 'personalwebsite'
-    ]
+    # First remove PII patterns
+    value = remove_pii_from_text(value)
     
-    return field_lower in remove_fields
+    # Then remove bias words
+    value = remove_bias_from_text(value)
+    
+    return _redact_names(value, field_lower)
+
+
+def _redact_names(value, field_lower):
+    """Additional PII removal for name fields, once PII and bias are removed."""
+    if _NAMEISH_RE.search(field_lower):
+        # Strip common first/last names
+        value = _COMMON_NAMES_UNION.sub('', value)
+        
+        # Clean up the result
+        value = ' '.join(value.split())
+        
+        # If it's empty or too short, use generic placeholder
+        if not value or len(value) < 3:
+            if 'institution' in field_lower or 'school' in field_lower or 'university' in field_lower:
+                return "[INSTITUTION]"
+            elif 'company' in field_lower or 'organization' in field_lower:
+                return "[ORGANIZATION]"
+            elif 'title' in field_lower:
+                return "[TITLE]"
+            else:
+                return "[NAME]"
+    
+    return value
+
 
+# Separator for joining many text values into one regex pass. It is neither
+# whitespace nor a word character, so no PII/bias pattern can match across it
+# (unlike '\x1f', which re treats as whitespace)
+_BATCH_SEPARATOR = '\x00'
 
-def should_hash_field(field_name):
+
+def anonymize_text_fields(values, fields_lower):
     """
-    Check if a field should be hashed.
+    Batch version of anonymize_text_field for many values at once.
+    
+    The values are joined with a separator so the PII and bias regexes each
+    run once over the whole batch instead of once per string.
     
     Args:
-        field_name: Field name
+        values: List of string values
+        fields_lower: Lowercased field name for each value
         
     Returns:
-        Boolean indicating if field should be hashed
+        List of anonymized strings, in the same order
     """
-    field_lower = field_name.lower()
+    results = [None] * len(values)
+    batched = []
+    for index, value in enumerate(values):
+        if _BATCH_SEPARATOR in value:
+            # Can't be joined safely; process on its own
+            results[index] = anonymize_text_field(value, fields_lower[index])
+        else:
+            batched.append(index)
     
-    # Fields that should be hashed
-    hash_fields = ['userid', 'employeeid', 'personid', 'candidateid', 'applicantid']
+    if batched:
+        blob = _BATCH_SEPARATOR.join(values[i] for i in batched)
+        if _PII_CANDIDATE_RE.search(blob):
+            pii_blob = _remove_pii_patterns(blob)
+        else:
+            pii_blob = blob
+        pii_values = pii_blob.split(_BATCH_SEPARATOR)
+        bias_values = _BIAS_UNION.sub('', pii_blob).split(_BATCH_SEPARATOR)
+        for index, pii_value, bias_value in zip(batched, pii_values, bias_values):
+            value = _tidy_bias_removal(bias_value, pii_value)
+            results[index] = _redact_names(value, fields_lower[index])
     
-    return field_lower in hash_fields
+    return results
+
+
+# Values dropped from the anonymized output
+_EMPTY_VALUES = (None, "", [], {})
 
 
 def anonymize_profile(profile_data):
@@ -289,313 +494,311 @@ def anonymize_profile(profile_data):
     Returns:
         Anonymized profile dictionary
     """
-    # Fields to preserve (don't anonymize)
-    preserve_fields = {
-        "code", "id", "jobCode", "externalSourceType",
-        "completionYear", "degree", "areaOfStudy", "certifications",
-        "crossDivisionalExperience", "internationalExperience",
-        "timeInCurrentRoleInDays", "version", "completionScore",
-        "businessDivisionCode", "businessUnitCode", "boardType",
-        "membershipType", "educationType", "certificationLevel"
-    }
+    return _anonymize_tree(profile_data, anonymize_text_field)
+
+
+def anonymize_profiles(profiles_data):
+    """
+    Anonymize every profile in a dictionary of profiles.
     
-    def process_value(value, field_name=""):
-        """Recursively process values in the profile."""
-        field_lower = field_name.lower()
+    Free text from all profiles is anonymized in one batch (see
+    anonymize_text_fields) rather than string by string.
+    
+    Args:
+        profiles_data: Dictionary mapping profile names to profiles
         
-        # Check if field should be removed entirely
-        if should_remove_field(field_name):
-            return None
+    Returns:
+        Dictionary mapping profile names to anonymized profiles
+    """
+    # First walk records the free-text values in visiting order; the walk
+    # order only depends on the input, so the second walk consumes the
+    # batch results in that same order
+    values = []
+    fields_lower = []
+    
+    def collect(value, field_lower):
+        values.append(value)
+        fields_lower.append(field_lower)
+        return value
+    
+    for profile in profiles_data.values():
+        _anonymize_tree(profile, collect)
+    
+    results = iter(anonymize_text_fields(values, fields_lower))
+    return {
+        name: _anonymize_tree(profile, lambda value, field_lower: next(results))
+        for name, profile in profiles_data.items()
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_anonymize_profile(profile_json):
+    """Anonymize a profile given as JSON bytes, cached across Streamlit reruns."""
+    return anonymize_profile(_loads_json(profile_json))
+
+
+def _anonymize_tree(profile_data, anonymize_text):
+    """Anonymize a profile, using anonymize_text(value, field_lower) for free text."""
+    # Walk the profile with an explicit stack instead of recursion, building
+    # fresh output containers (the input is never mutated). Each entry is
+    # (value, field_name, parent, key, finished): parent is the output
+    # container the result goes into, or None for the root. A dict/list is
+    # pushed back with finished=True under its children and only attached
+    # once they are all processed, so empty containers are dropped in the
+    # same walk.
+    stack = [(profile_data, "", None, None, False)]
+    
+    while stack:
+        value, field_name, parent, key, finished = stack.pop()
         
-        if isinstance(value, dict):
-            # Process dictionary
-            result = {}
-            for k, v in value.items():
-                processed = process_value(v, k)
-                # Only add if not None (not removed)
-                if processed is not None:
-                    result[k] = processed
-            return result
-            
-        elif isinstance(value, list):
-            # Process list
-            processed_list = []
-            for item in value:
-                processed = process_value(item, field_name)
-                if processed is not None:
-                    processed_list.append(processed)
-            return processed_list
-            
-        elif isinstance(value, str):
-            # Process string based on field type
-            
-            # Preserve certain fields
-            if field_name in preserve_fields:
-                return value
-            
-            # Hash user IDs
-            if should_hash_field(field_name):
-                return hash_identifier(value)
-            
-            # Anonymize dates
-            if 'date' in field_lower or 'time' in field_lower:
-                return anonymize_date(value)
+        if finished:
+            processed = value
+        else:
+            field_lower = field_name.lower()
             
-            # First remove PII patterns
-            value = remove_pii_from_text(value)
+            # Check if field should be removed entirely
+            if field_lower in _REMOVE_FIELDS:
+                continue
             
-            # Then remove bias words
-            value = remove_bias_from_text(value)
+            if isinstance(value, dict):
+                # Process dictionary; children are pushed reversed to keep key order
+                built = {}
+                stack.append((built, field_name, parent, key, True))
+                for k, v in reversed(value.items()):
+                    stack.append((v, k, built, k, False))
+                continue
             
-            # Additional PII removal for name fields
-            if any(name_field in field_lower for name_field in ['name', 'title', 'organization', 'institution', 'company']):
-                # Check if it looks like a person's name (contains common first/last names)
-                common_names = ['john', 'jane', 'smith', 'garcia', 'chen', 'williams', 'johnson', 
-                              'brown', 'jones', 'miller', 'davis', 'wilson', 'anderson', 'taylor',
-                              'thomas', 'jackson', 'martin', 'lee', 'thompson', 'white', 'harris',
-                              'clark', 'lewis', 'robinson', 'walker', 'hall', 'allen', 'king']
-                
-                for name in common_names:
-                    if name in value.lower():
-                        value = re.sub(r'\b' + name + r'\b', '', value, flags=re.IGNORECASE)
-                
-                # Clean up the result
-                value = re.sub(r'\s+', ' ', value).strip()
-                
-                # If it's empty or too short, use generic placeholder
-                if not value or len(value) < 3:
-                    if 'institution' in field_lower or 'school' in field_lower or 'university' in field_lower:
-                        return "[INSTITUTION]"
-                    elif 'company' in field_lower or 'organization' in field_lower:
-                        return "[ORGANIZATION]"
-                    elif 'title' in field_lower:
-                        return "[TITLE]"
-                    else:
-                        return "[NAME]"
+            elif isinstance(value, list):
+                # Process list; items inherit the list's field name
+                built = []
+                stack.append((built, field_name, parent, key, True))
+                for item in reversed(value):
+                    stack.append((item, field_name, built, None, False))
+                continue
             
-            return value
+            elif isinstance(value, str):
+                # Process string based on field type
+                if field_name in _PRESERVE_FIELDS:
+                    # Preserve certain fields
+                    processed = value
+                elif field_lower in _HASH_FIELDS:
+                    # Hash user IDs
+                    processed = _hash_identifier_text(value) if value else value
+                elif _DATETIME_RE.search(field_lower):
+                    # Anonymize dates
+                    processed = anonymize_date(value)
+                else:
+                    processed = anonymize_text(value, field_lower)
             
-        else:
-            # Return other types as-is (numbers, booleans, None)
-            return value
-    
-    # Create a deep copy and process it
-    anonymized = copy.deepcopy(profile_data)
-    anonymized = process_value(anonymized)
-    
-    # Clean up empty structures
-    def clean_empty(data):
-        """Remove empty strings, lists, and dictionaries."""
-        if isinstance(data, dict):
-            result = {}
-            for k, v in data.items():
-                cleaned = clean_empty(v)
-                if cleaned not in [None, "", [], {}]:
-                    result[k] = cleaned
-            return result
-        elif isinstance(data, list):
-            result = []
-            for item in data:
-                cleaned = clean_empty(item)
-                if cleaned not in [None, "", [], {}]:
-                    result.append(cleaned)
-            return result
-        else:
-            return data
-    
-    anonymized = clean_empty(anonymized)
-    
-    return anonymized
+            else:
+                # Keep other types as-is (numbers, booleans, None)
+                processed = value
+        
+        if parent is None:
+            # The root is returned even when empty
+            return processed
+        
+        # Only add if not removed or empty
+        if processed not in _EMPTY_VALUES:
+            if isinstance(parent, list):
+                parent.append(processed)
+            else:
+                parent[key] = processed
 
 
-def get_sample_profiles():
-    """Get sample profiles for demonstration."""
-    return {
-        "Profile_001_John_Smith": {
-            "userId": "USER_12345",
-            "externalSourceType": "LinkedIn",
-            "core": {
-                "rank": {
-                    "code": "L7",
-                    "description": "Senior Principal Engineer - White male, 45 years old",
-                    "id": "RANK_007"
-                },
-                "employeeType": {
-                    "code": "FTE",
-                    "description": "Full Time Employee - Married with children"
-                },
-                "businessTitle": "Senior Engineer from wealthy background",
-                "jobCode": "ENG_SR_001",
-                "enterpriseSeniorityDate": "1995-06-15",
-                "gcrs": {
-                    "businessDivisionCode": "TECH",
-                    "businessDivisionDescription": "Technology Division - Predominantly white males",
-                    "businessUnitCode": "CLOUD",
-                    "businessUnitDescription": "Cloud Computing Unit"
-                },
-                "workLocation": {
-                    "code": "SF_HQ_01",
-                    "description": "San Francisco Headquarters - Liberal area",
-                    "city": "San Francisco",
-                    "state": "California",
-                    "country": "United States"
-                },
-                "reportingDistance": {
-                    "geb": "3",
-                    "ceo": "4",
-                    "chairman": "5"
-                }
-            },
-            "workEligibility": "US Citizen, no visa required",
-            "language": {
-                "languages": ["English - Native", "Spanish - Basic"],
-                "createdBy": "Admin John",
-                "lastModifiedBy": "Manager Sarah Williams",
-                "email": "john.smith@company.com",
-                "phone": "415-555-1234"
+# Sample profiles for demonstration, built once at import rather than on
+# every Streamlit rerun; treat as read-only
+_SAMPLE_PROFILES = {
+    "Profile_001_John_Smith": {
+        "userId": "USER_12345",
+        "externalSourceType": "LinkedIn",
+        "core": {
+            "rank": {
+                "code": "L7",
+                "description": "Senior Principal Engineer - White male, 45 years old",
+                "id": "RANK_007"
             },
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Google - Known for young workforce",
-                        "jobTitle": "Senior Engineering Manager for white collar workers",
-                        "description": "Led diverse team including Asian and Hispanic engineers",
-                        "startDate": "2015-03-01",
-                        "endDate": "2020-12-31",
-                        "id": "EXP_001"
-                    }
-                ],
-                "crossDivisionalExperience": "Yes",
-                "internationalExperience": "Yes",
-                "timeInCurrentRoleInDays": "1095"
+            "employeeType": {
+                "code": "FTE",
+                "description": "Full Time Employee - Married with children"
             },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "Stanford University - Elite private school for wealthy families",
-                        "degree": "MS Computer Science",
-                        "areaOfStudy": "Machine Learning",
-                        "completionYear": 2000,
-                        "achievements": "Summa Cum Laude, from wealthy donor family"
-                    }
-                ],
-                "certifications": ["AWS Solutions Architect", "Google Cloud Professional"]
+            "businessTitle": "Senior Engineer from wealthy background",
+            "jobCode": "ENG_SR_001",
+            "enterpriseSeniorityDate": "1995-06-15",
+            "gcrs": {
+                "businessDivisionCode": "TECH",
+                "businessDivisionDescription": "Technology Division - Predominantly white males",
+                "businessUnitCode": "CLOUD",
+                "businessUnitDescription": "Cloud Computing Unit"
             },
-            "affiliation": {
-                "boards": [
-                    {
-                        "organizationName": "Country Club - Mostly white males",
-                        "position": "Board Member",
-                        "boardType": "advisory"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Best Manager Award from CEO John Anderson",
-                        "organization": "Tech Corp",
-                        "date": "2023-05-15"
-                    }
-                ],
-                "memberships": []
+            "workLocation": {
+                "code": "SF_HQ_01",
+                "description": "San Francisco Headquarters - Liberal area",
+                "city": "San Francisco",
+                "state": "California",
+                "country": "United States"
             },
-            "careerAspirationPreference": "Looking to lead C-suite with other white executives",
-            "careerLocationPreference": "Prefer conservative Republican states",
-            "careerRolePreference": "Looking for young, energetic team without family obligations",
-            "personalEmail": "johnsmith@gmail.com",
-            "personalPhone": "650-555-9876",
-            "version": "1.0",
-            "completionScore": "95"
+            "reportingDistance": {
+                "geb": "3",
+                "ceo": "4",
+                "chairman": "5"
+            }
+        },
+        "workEligibility": "US Citizen, no visa required",
+        "language": {
+            "languages": ["English - Native", "Spanish - Basic"],
+            "createdBy": "Admin John",
+            "lastModifiedBy": "Manager Sarah Williams",
+            "email": "john.smith@company.com",
+            "phone": "415-555-1234"
         },
-        "Profile_002_Maria_Garcia": {
-            "userId": "USER_67890",
-            "externalSourceType": "Internal",
-            "core": {
-                "rank": {
-                    "code": "L5",
-                    "description": "Software Engineer - Hispanic female, single mother",
-                    "id": "RANK_005"
-                },
-                "employeeType": {
-                    "code": "FTE",
-                    "description": "Full Time - Needs childcare flexibility for disabled child"
-                },
-                "businessTitle": "Engineer from working-class immigrant family",
-                "jobCode": "ENG_MID_002",
-                "workLocation": {
-                    "code": "NY_01",
-                    "city": "New York",
-                    "state": "New York"
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Google - Known for young workforce",
+                    "jobTitle": "Senior Engineering Manager for white collar workers",
+                    "description": "Led diverse team including Asian and Hispanic engineers",
+                    "startDate": "2015-03-01",
+                    "endDate": "2020-12-31",
+                    "id": "EXP_001"
                 }
+            ],
+            "crossDivisionalExperience": "Yes",
+            "internationalExperience": "Yes",
+            "timeInCurrentRoleInDays": "1095"
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "Stanford University - Elite private school for wealthy families",
+                    "degree": "MS Computer Science",
+                    "areaOfStudy": "Machine Learning",
+                    "completionYear": 2000,
+                    "achievements": "Summa Cum Laude, from wealthy donor family"
+                }
+            ],
+            "certifications": ["AWS Solutions Architect", "Google Cloud Professional"]
+        },
+        "affiliation": {
+            "boards": [
+                {
+                    "organizationName": "Country Club - Mostly white males",
+                    "position": "Board Member",
+                    "boardType": "advisory"
+                }
+            ],
+            "awards": [
+                {
+                    "name": "Best Manager Award from CEO John Anderson",
+                    "organization": "Tech Corp",
+                    "date": "2023-05-15"
+                }
+            ],
+            "memberships": []
+        },
+        "careerAspirationPreference": "Looking to lead C-suite with other white executives",
+        "careerLocationPreference": "Prefer conservative Republican states",
+        "careerRolePreference": "Looking for young, energetic team without family obligations",
+        "personalEmail": "johnsmith@gmail.com",
+        "personalPhone": "650-555-9876",
+        "version": "1.0",
+        "completionScore": "95"
+    },
+    "Profile_002_Maria_Garcia": {
+        "userId": "USER_67890",
+        "externalSourceType": "Internal",
+        "core": {
+            "rank": {
+                "code": "L5",
+                "description": "Software Engineer - Hispanic female, single mother",
+                "id": "RANK_005"
             },
-            "workEligibility": "Green Card holder from Mexico, married to US citizen",
-            "affiliation": {
-                "memberships": [
-                    {
-                        "organizationName": "Women in Tech - Feminist organization for lesbians",
-                        "role": "Active Member",
-                        "since": "2018"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Diversity Champion Award from Sarah Johnson",
-                        "organization": "LGBTQ Tech Alliance",
-                        "description": "For supporting gay and lesbian colleagues",
-                        "recipientEmail": "maria.garcia@company.com"
-                    }
-                ]
-            },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "State University - Public school for poor students",
-                        "degree": "BS Computer Science",
-                        "areaOfStudy": "Software Engineering",
-                        "completionYear": 2015
-                    }
-                ]
+            "employeeType": {
+                "code": "FTE",
+                "description": "Full Time - Needs childcare flexibility for disabled child"
             },
-            "careerPreference": "Seeking inclusive environment, flexible for elderly parent care",
-            "createdBy": "HR Manager Bob Smith",
-            "lastModifiedBy": "Director Jane Williams"
+            "businessTitle": "Engineer from working-class immigrant family",
+            "jobCode": "ENG_MID_002",
+            "workLocation": {
+                "code": "NY_01",
+                "city": "New York",
+                "state": "New York"
+            }
         },
-        "Profile_003_David_Chen": {
-            "userId": "USER_11111",
-            "core": {
-                "rank": {
-                    "code": "L6",
-                    "description": "Senior Engineer - Asian male, Buddhist, gay married to partner",
-                    "id": "RANK_006"
-                },
-                "businessTitle": "Engineer - Gay partnered, no children due to homosexuality",
-                "jobCode": "ENG_SR_003",
-                "workLocation": {
-                    "code": "SEA_01",
-                    "city": "Seattle",
-                    "state": "Washington"
+        "workEligibility": "Green Card holder from Mexico, married to US citizen",
+        "affiliation": {
+            "memberships": [
+                {
+                    "organizationName": "Women in Tech - Feminist organization for lesbians",
+                    "role": "Active Member",
+                    "since": "2018"
                 }
+            ],
+            "awards": [
+                {
+                    "name": "Diversity Champion Award from Sarah Johnson",
+                    "organization": "LGBTQ Tech Alliance",
+                    "description": "For supporting gay and lesbian colleagues",
+                    "recipientEmail": "maria.garcia@company.com"
+                }
+            ]
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "State University - Public school for poor students",
+                    "degree": "BS Computer Science",
+                    "areaOfStudy": "Software Engineering",
+                    "completionYear": 2015
+                }
+            ]
+        },
+        "careerPreference": "Seeking inclusive environment, flexible for elderly parent care",
+        "createdBy": "HR Manager Bob Smith",
+        "lastModifiedBy": "Director Jane Williams"
+    },
+    "Profile_003_David_Chen": {
+        "userId": "USER_11111",
+        "core": {
+            "rank": {
+                "code": "L6",
+                "description": "Senior Engineer - Asian male, Buddhist, gay married to partner",
+                "id": "RANK_006"
             },
-            "workEligibility": "H1-B Visa from China, seeking green card through gay marriage",
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Microsoft",
-                        "jobTitle": "Software Engineer",
-                        "description": "Worked with predominantly Indian and Chinese team of immigrants",
-                        "startDate": "2018-01-15",
-                        "managerEmail": "manager@microsoft.com",
-                        "managerPhone": "206-555-4321"
-                    }
-                ],
-                "personalReference": "Former manager John Davis at 425-555-1111"
-            },
-            "careerPreference": "Prefer LGBTQ-friendly, liberal Democrat environment",
-            "socialMedia": {
-                "linkedin": "linkedin.com/in/davidchen",
-                "twitter": "@davidchen_tech"
+            "businessTitle": "Engineer - Gay partnered, no children due to homosexuality",
+            "jobCode": "ENG_SR_003",
+            "workLocation": {
+                "code": "SEA_01",
+                "city": "Seattle",
+                "state": "Washington"
             }
+        },
+        "workEligibility": "H1-B Visa from China, seeking green card through gay marriage",
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Microsoft",
+                    "jobTitle": "Software Engineer",
+                    "description": "Worked with predominantly Indian and Chinese team of immigrants",
+                    "startDate": "2018-01-15",
+                    "managerEmail": "manager@microsoft.com",
+                    "managerPhone": "206-555-4321"
+                }
+            ],
+            "personalReference": "Former manager John Davis at 425-555-1111"
+        },
+        "careerPreference": "Prefer LGBTQ-friendly, liberal Democrat environment",
+        "socialMedia": {
+            "linkedin": "linkedin.com/in/davidchen",
+            "twitter": "@davidchen_tech"
         }
     }
+}
+
+
+def get_sample_profiles():
+    """Get sample profiles for demonstration."""
+    return _SAMPLE_PROFILES
 
 
 def main():
@@ -608,6 +811,12 @@ def main():
         st.session_state.anonymized_profile = None
     if 'selected_profile' not in st.session_state:
         st.session_state.selected_profile = None
+    if 'original_len' not in st.session_state:
+        st.session_state.original_len = 0
+    if 'anonymized_len' not in st.session_state:
+        st.session_state.anonymized_len = 0
+    if 'anonymized_json' not in st.session_state:
+        st.session_state.anonymized_json = None
     
     # Header
     st.markdown("""
@@ -631,7 +840,7 @@ def main():
         # Load profiles
         if uploaded_file is not None:
             try:
-                profiles_data = json.load(uploaded_file)
+                profiles_data = _loads_json(uploaded_file.getvalue())
                 st.session_state.profiles_data = profiles_data
                 st.success(f"✅ Loaded {len(profiles_data)} profiles")
             except Exception as e:
@@ -654,12 +863,30 @@ def main():
         if st.session_state.anonymized_profile:
             st.success("✅ Profile Anonymized")
             
-            # Count removed bias terms (simple approximation)
-            original_str = json.dumps(st.session_state.selected_profile)
-            anonymized_str = json.dumps(st.session_state.anonymized_profile)
-            reduction = len(original_str) - len(anonymized_str)
+            # Count removed bias terms (simple approximation); lengths are
+            # measured once when the profile is anonymized, not on every rerun
+            original_len = st.session_state.original_len
+            reduction = original_len - st.session_state.anonymized_len
             st.metric("Characters Removed", reduction)
-            st.metric("Reduction %", f"{(reduction/len(original_str)*100):.1f}%")
+            st.metric("Reduction %", f"{(reduction/original_len*100):.1f}%")
+        
+        st.divider()
+        
+        # Anonymize the whole file in one batch
+        if st.button("🔒 Anonymize All Profiles", use_container_width=True):
+            with st.spinner("Removing bias words and PII from all profiles..."):
+                st.session_state.all_anonymized_json = _dumps_json(
+                    anonymize_profiles(profiles_data), indent=True
+                )
+        
+        if st.session_state.get('all_anonymized_json'):
+            st.download_button(
+                label="📥 Download All Anonymized Profiles",
+                data=st.session_state.all_anonymized_json,
+                file_name="anonymized_profiles.json",
+                mime="application/json",
+                use_container_width=True
+            )
     
     # Main content area
     if profiles_data:
@@ -699,11 +926,20 @@ def main():
             with col2:
                 if st.button("🔒 Anonymize Profile", type="primary", use_container_width=True):
                     with st.spinner("Removing bias words and PII..."):
-                        # Call the anonymize function with the selected profile
-                        anonymized = anonymize_profile(st.session_state.selected_profile)
+                        # Call the anonymize function with the selected profile;
+                        # its JSON is the cache key, so repeat clicks on the same
+                        # profile are served from the cache
+                        profile_json = _dumps_json(st.session_state.selected_profile)
+                        anonymized = _cached_anonymize_profile(profile_json)
                         
                         # Store the result
                         st.session_state.anonymized_profile = anonymized
+                        st.session_state.original_len = len(profile_json)
+                        st.session_state.anonymized_len = len(_dumps_json(anonymized))
+                        
+                        # Serialize the download payload once here rather than on
+                        # every rerun that shows the download button
+                        st.session_state.anonymized_json = _dumps_json(anonymized, indent=True)
                         
                         # Show success message
                         st.success("✅ Profile successfully anonymized!")
@@ -719,15 +955,15 @@ def main():
             with col1:
                 if st.button("🔄 Reset", use_container_width=True):
                     st.session_state.anonymized_profile = None
+                    st.session_state.anonymized_json = None
                     st.rerun()
             
             with col2:
                 if st.session_state.anonymized_profile:
                     # Download button for anonymized profile
-                    anonymized_json = json.dumps(st.session_state.anonymized_profile, indent=2)
                     st.download_button(
                         label="📥 Download Anonymized Profile",
-                        data=anonymized_json,
+                        data=st.session_state.anonymized_json,
                         file_name=f"anonymized_{selected_entry}.json",
                         mime="application/json",
                         use_container_width=True
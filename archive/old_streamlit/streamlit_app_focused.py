@@ -8,9 +8,21 @@ import json
 import sys
 import os
 import re
-import copy
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson is a much faster C implementation of JSON serialization; fall back
+# to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Page configuration
 st.set_page_config(
     page_title="Talent Profile Anonymizer",
@@ -113,12 +125,131 @@ BIAS_WORDS = {
     ]
 }
 
-# Flatten all bias words into a single list
-ALL_BIAS_WORDS = []
-for category_words in BIAS_WORDS.values():
-    ALL_BIAS_WORDS.extend(category_words)
+# All bias words from every category, lowercased and deduplicated (several
+# appear in more than one category), longest first so phrases such as
+# "baby boomer" take precedence over their shorter components
+ALL_BIAS_WORDS = tuple(sorted(
+    {word.lower() for category_words in BIAS_WORDS.values() for word in category_words},
+    key=lambda word: (-len(word), word)
+))
+
+# Single-word bias terms, looked up per word token
+_BIAS_WORD_SET = frozenset(
+    word for word in ALL_BIAS_WORDS if re.fullmatch(r'\w+', word)
+)
+
+# Hyphenated and multi-word terms ("baby boomer", "white-collar") span several
+# tokens, so they keep a short alternation, longest first
+_BIAS_PHRASE_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(word) for word in ALL_BIAS_WORDS if word not in _BIAS_WORD_SET
+    ) + r')s?\b',
+    re.IGNORECASE
+)
+
+_TOKEN_RE = re.compile(r'\w+|\W+')
+
+
+# Aho-Corasick automaton over the lowercased bias words and their plural
+# forms; finds every occurrence in one linear pass. Falls back to the token
+# lookup when pyahocorasick is not installed.
+if ahocorasick is not None:
+    _BIAS_AUTOMATON = ahocorasick.Automaton()
+    for _word in ALL_BIAS_WORDS:
+        for _form in (_word, _word + 's'):
+            _BIAS_AUTOMATON.add_word(_form, len(_form))
+    _BIAS_AUTOMATON.make_automaton()
+else:
+    _BIAS_AUTOMATON = None
+
+
+# Characters re.IGNORECASE treats as an ASCII letter although lower() doesn't
+# map them to it: dotted capital I, dotless i and long s
+_CASE_FOLD = str.maketrans('\u0130\u0131\u017f', 'iis')
+
+
+def _is_word_char(char):
+    """Mirror the regex \\w class so boundaries match the token lookup."""
+    return char.isalnum() or char == '_'
+
+
+def _strip_bias_tokens(text):
+    """
+    Splice bias words out of text by word-token lookup.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Text with bias words removed
+    """
+    text = _BIAS_PHRASE_RE.sub('', text)
+    
+    out = []
+    for token in _TOKEN_RE.findall(text):
+        lowered = token.translate(_CASE_FOLD).lower()
+        if lowered in _BIAS_WORD_SET or (
+            lowered.endswith('s') and lowered[:-1] in _BIAS_WORD_SET
+        ):
+            continue
+        out.append(token)
+    return ''.join(out)
+
+
+def _strip_bias_words(text):
+    """
+    Splice every bias word out of text.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Text with bias words removed, same as _strip_bias_tokens(text)
+    """
+    lowered = text.translate(_CASE_FOLD).lower()
+    # Lowercasing can change the length of some non-ASCII text, which would
+    # misalign the match offsets
+    if _BIAS_AUTOMATON is None or len(lowered) != len(text):
+        return _strip_bias_tokens(text)
+    
+    # Longest match starting at each position that sits on word boundaries
+    longest = {}
+    for end_index, length in _BIAS_AUTOMATON.iter(lowered):
+        start = end_index - length + 1
+        end = end_index + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        if end > longest.get(start, start):
+            longest[start] = end
+    
+    if not longest:
+        return text
+    
+    # Take matches left to right, skipping any that overlap the previous one
+    pieces = []
+    position = 0
+    for start in sorted(longest):
+        if start < position:
+            continue
+        pieces.append(text[position:start])
+        position = longest[start]
+    pieces.append(text[position:])
+    return ''.join(pieces)
 
 
+# Cleanup patterns for text left after bias removal
+_WS_RE = re.compile(r'\s+')
+_DASH_RE = re.compile(r'\s*-\s*-\s*')
+_COMMA_RE = re.compile(r'\s*,\s*,\s*')
+
+
+# NOTE: don't put @numba.jit on the text functions below. Numba falls back to
+# object mode for str operations (slower than plain CPython) and doesn't
+# support 're' in nopython mode. For speed use the pyahocorasick automaton
+# above, the batched passes in anonymize_text_fields and st.cache_data.
+@lru_cache(maxsize=4096)
 def remove_bias_from_text(text):
     """
     Remove bias words from text.
@@ -132,20 +263,25 @@ def remove_bias_from_text(text):
     if not text or not isinstance(text, str):
         return text
     
-    result = text
-    
-    # Remove each bias word (case-insensitive)
-    for word in ALL_BIAS_WORDS:
-        # Use word boundaries for accurate matching
-        pattern = r'\b' + re.escape(word) + r's?\b'
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-    
+    # Remove all bias words (case-insensitive) in one pass
+    return _tidy_bias_removal(_strip_bias_words(text), text)
+
+
+def _tidy_bias_removal(result, text):
+    """Clean up the text left after stripping bias words from text."""
     # Clean up extra spaces
-    result = re.sub(r'\s+', ' ', result).strip()
-    result = re.sub(r'\s*-\s*-\s*', ' - ', result)
-    result = re.sub(r'\s*,\s*,\s*', ', ', result)
-    result = re.sub(r'\s*:\s*$', '', result)
-    result = re.sub(r'^\s*-\s*', '', result)
+    result = _WS_RE.sub(' ', result).strip()
+    result = _DASH_RE.sub(' - ', result)
+    result = _COMMA_RE.sub(', ', result)
+    
+    # Drop one trailing colon and one leading dash, with the whitespace
+    # around each
+    stripped = result.rstrip()
+    if stripped.endswith(':'):
+        result = stripped[:-1].rstrip()
+    stripped = result.lstrip()
+    if stripped.startswith('-'):
+        result = stripped[1:].lstrip()
     
     # Return placeholder if string became empty
     if not result and len(text) > 5:
@@ -154,6 +290,26 @@ def remove_bias_from_text(text):
     return result
 
 
+# Email, phone and social media patterns, applied in this order. The four
+# social media links share one case-insensitive pattern; its alternatives all
+# run to the next whitespace, so the leftmost one wins exactly as the
+# separate passes did. Email and phone stay separate passes because a
+# single alternation lets one match swallow the start of another, and the
+# handle pass comes last so that it only sees what the links left.
+_SOCIAL_LINK = r'(?:https?://)?(?:www\.)?(?:linkedin|twitter|facebook|github)\.com/'
+_PII_PASSES = (
+    re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    re.compile(r'(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    re.compile(_SOCIAL_LINK + r'[^\s]*', re.IGNORECASE),
+    re.compile(r'@[A-Za-z0-9_]+', re.IGNORECASE),  # Twitter handles
+)
+
+# Every PII pattern needs a digit, an '@' or a ".com/" link, so text without
+# any of them is skipped
+_PII_CANDIDATE_RE = re.compile(r'[\d@]|\.com/', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def remove_pii_patterns(text):
     """
     Remove only email, phone, and social media links.
@@ -167,298 +323,480 @@ def remove_pii_patterns(text):
     if not text or not isinstance(text, str):
         return text
     
-    result = text
+    # Most fields hold none of the characters PII needs
+    if not _PII_CANDIDATE_RE.search(text):
+        return text
+    
+    return _remove_pii(text)
+
+
+def _remove_pii(text, passes=_PII_PASSES):
+    """Replace every PII match in text with 'removed', pattern by pattern."""
+    for pattern in passes:
+        text = pattern.sub('removed', text)
+    return text
+
+
+# Sections to process for bias removal; matched as substrings of field names
+_BIAS_SECTIONS = ('experience', 'qualification', 'education')
+
+# Fields where we should remove organization/institution names
+_ORG_NAME_FIELDS = frozenset(['institutionName', 'company', 'organizationName', 'organization'])
+
+# Keywords that mark an organization/institution name
+_INSTITUTION_KEYWORDS = ('university', 'college', 'institute', 'school', 'company', 'corp', 'inc', 'ltd')
+
+# Structural metadata fields (IDs, codes, dates, scores) that never hold bias
+# words or PII; their string values are kept as-is
+_SKIP_FIELDS = frozenset([
+    'userId', 'id', 'code', 'jobCode', 'rank', 'startDate', 'endDate', 'date',
+    'since', 'completionYear', 'completionScore', 'version', 'timeInCurrentRoleInDays'
+])
+
+# Dates, years and numeric codes ("2015-03-01", "1095", "1.0"): digits joined
+# by single dashes or by : . / with no letters or whitespace. With fewer than
+# the ten digits a phone number needs, every step leaves these unchanged.
+_CHEAP_SKIP_RE = re.compile(r'\d+(?:[:./]+\d+|-\d+)*')
+
+
+def anonymize_text_field(value, field_name, in_bias_section):
+    """
+    Anonymize a single free-text value.
     
-    # Remove email addresses
-    result = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 'removed', result)
+    Args:
+        value: String value
+        field_name: Name of the field holding the value
+        in_bias_section: Whether the value is inside an experience,
+            qualification or education section
+        
+    Returns:
+        Anonymized string
+    """
+    # First, always remove email, phone, and social media
+    value = remove_pii_patterns(value)
     
-    # Remove phone numbers
-    result = re.sub(r'(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', 'removed', result)
+    cleaned = None
+    if field_name in _ORG_NAME_FIELDS or in_bias_section:
+        cleaned = remove_bias_from_text(value)
+    return _finish_text_field(value, cleaned, field_name, in_bias_section)
+
+
+def _finish_text_field(value, cleaned, field_name, in_bias_section):
+    """Pick the output for a PII-free value given its bias-cleaned form."""
+    # Remove organization/institution names if in those fields
+    if field_name in _ORG_NAME_FIELDS:
+        # Remove bias words and then replace with "removed"
+        if cleaned != value:  # If bias was found and removed
+            return "removed"
+        # If no bias, keep original but still check for names
+        lowered = value.lower()
+        if any(name in lowered for name in _INSTITUTION_KEYWORDS):
+            return "removed"
     
-    # Remove social media links
-    social_patterns = [
-        r'(?:https?://)?(?:www\.)?linkedin\.com/[^\s]*',
-        r'(?:https?://)?(?:www\.)?twitter\.com/[^\s]*',
-        r'(?:https?://)?(?:www\.)?facebook\.com/[^\s]*',
-        r'(?:https?://)?(?:www\.)?github\.com/[^\s]*',
-        r'@[A-Za-z0-9_]+',  # Twitter handles
-    ]
-    for pattern in social_patterns:
-        result = re.sub(pattern, 'removed', result, flags=re.IGNORECASE)
+    # If we're in experience/qualification/education section, remove bias
+    if in_bias_section:
+        return cleaned
     
-    return result
+    return value
+
+
+# Separator for joining many text values into one regex pass. It is neither
+# whitespace nor a word character, so no bias word or PII pattern can match
+# across it, and stripping bias words can't create one. The links run to the
+# next whitespace, so in a batch they also stop at the separator.
+_BATCH_SEPARATOR = '\x00'
+_BATCH_PII_PASSES = (
+    _PII_PASSES[:2]
+    + (re.compile(_SOCIAL_LINK + r'[^\s\x00]*', re.IGNORECASE),)
+    + _PII_PASSES[3:]
+)
+
+
+def anonymize_text_fields(values, field_names, in_bias_sections):
+    """
+    Batch version of anonymize_text_field for many values at once.
+    
+    The values are joined with a separator so the PII and bias passes each
+    run once over the whole batch instead of once per string.
+    
+    Args:
+        values: List of string values
+        field_names: Field name for each value
+        in_bias_sections: Bias-section flag for each value
+        
+    Returns:
+        List of anonymized strings, in the same order
+    """
+    results = [None] * len(values)
+    batched = []
+    for index, value in enumerate(values):
+        if _BATCH_SEPARATOR in value:
+            # Can't be joined safely; process on its own
+            results[index] = anonymize_text_field(value, field_names[index], in_bias_sections[index])
+        else:
+            batched.append(index)
+    
+    if not batched:
+        return results
+    
+    # Only values that could hold PII go through the PII pass, and repeated
+    # values (labels, boilerplate) are joined only once
+    candidates = list(dict.fromkeys(
+        values[i] for i in batched if _PII_CANDIDATE_RE.search(values[i])
+    ))
+    redacted = {}
+    if candidates:
+        redacted = dict(zip(candidates, _remove_pii(
+            _BATCH_SEPARATOR.join(candidates), _BATCH_PII_PASSES
+        ).split(_BATCH_SEPARATOR)))
+    pii_values = [redacted.get(values[i], values[i]) for i in batched]
+    
+    # Only org-name fields and bias sections need the bias pass
+    needs_bias = list(dict.fromkeys(
+        pii_value for pii_value, index in zip(pii_values, batched)
+        if field_names[index] in _ORG_NAME_FIELDS or in_bias_sections[index]
+    ))
+    cleaned = {}
+    if needs_bias:
+        stripped = _strip_bias_words(_BATCH_SEPARATOR.join(needs_bias)).split(_BATCH_SEPARATOR)
+        cleaned = {
+            pii_value: _tidy_bias_removal(bias_value, pii_value) if pii_value else pii_value
+            for pii_value, bias_value in zip(needs_bias, stripped)
+        }
+    
+    for pii_value, index in zip(pii_values, batched):
+        results[index] = _finish_text_field(
+            pii_value, cleaned.get(pii_value), field_names[index], in_bias_sections[index]
+        )
+    return results
 
 
 def anonymize_profile(profile_data):
     """
     Function to anonymize a profile focusing on experience, education, and qualification sections.
     
+    Free text is anonymized in one batch (see anonymize_text_fields) rather
+    than string by string.
+    
     Args:
         profile_data: The talent profile dictionary
         
     Returns:
         Anonymized profile dictionary
     """
-    # Create a deep copy
-    anonymized = copy.deepcopy(profile_data)
+    # First walk records the free-text values in visiting order; the walk
+    # order only depends on the input, so the second walk consumes the
+    # batch results in that same order
+    values = []
+    field_names = []
+    in_bias_sections = []
     
-    # Define which sections to process for bias removal
-    bias_removal_sections = ['experience', 'qualification', 'education']
+    def collect(value, field_name, in_bias_section):
+        values.append(value)
+        field_names.append(field_name)
+        in_bias_sections.append(in_bias_section)
+        return value
     
-    # Fields where we should remove organization/institution names
-    org_name_fields = ['institutionName', 'company', 'organizationName', 'organization']
+    _anonymize_tree(profile_data, collect)
     
-    def process_value(value, field_name="", parent_path=""):
-        """Recursively process values in the profile."""
-        
-        # Check if we're in a section that needs bias removal
-        in_bias_section = any(section in parent_path.lower() for section in bias_removal_sections)
+    results = iter(anonymize_text_fields(values, field_names, in_bias_sections))
+    return _anonymize_tree(profile_data, lambda value, field_name, in_bias_section: next(results))
+
+
+def _anonymize_tree(profile_data, anonymize_text):
+    """Anonymize a profile, using anonymize_text(value, field_name, in_bias_section) for free text."""
+    # Walk the profile with an explicit stack instead of recursion, building
+    # fresh output containers (the input is never mutated). Each entry is
+    # (value, field_name, in_bias_section, parent, key): parent is the output
+    # container the result goes into, or None for the root. Children are
+    # pushed reversed so they are visited, and attached, in their original
+    # order.
+    anonymized = None
+    stack = [(profile_data, "", False, None, None)]
+    
+    while stack:
+        value, field_name, in_bias_section, parent, key = stack.pop()
         
         if isinstance(value, dict):
-            # Process dictionary
-            result = {}
-            for k, v in value.items():
-                new_path = f"{parent_path}.{k}" if parent_path else k
-                result[k] = process_value(v, k, new_path)
-            return result
+            # Process dictionary; once inside a bias section, everything
+            # below it is too, so only check keys until then
+            processed = {}
+            for k, v in reversed(value.items()):
+                child_in_section = in_bias_section or any(
+                    section in k.lower() for section in _BIAS_SECTIONS
+                )
+                stack.append((v, k, child_in_section, processed, k))
             
         elif isinstance(value, list):
-            # Process list
-            return [process_value(item, field_name, parent_path) for item in value]
+            # Process list; items inherit the list's field name
+            processed = []
+            for item in reversed(value):
+                stack.append((item, field_name, in_bias_section, processed, None))
             
         elif isinstance(value, str):
             # Process string
-            
-            # First, always remove email, phone, and social media
-            value = remove_pii_patterns(value)
-            
-            # Remove organization/institution names if in those fields
-            if field_name in org_name_fields:
-                # Remove bias words and then replace with "removed"
-                cleaned = remove_bias_from_text(value)
-                if cleaned != value:  # If bias was found and removed
-                    return "removed"
-                # If no bias, keep original but still check for names
-                if any(name in value.lower() for name in ['university', 'college', 'institute', 'school', 'company', 'corp', 'inc', 'ltd']):
-                    return "removed"
-            
-            # If we're in experience/qualification/education section, remove bias
-            if in_bias_section:
-                value = remove_bias_from_text(value)
-            
-            return value
+            if field_name in _SKIP_FIELDS:
+                processed = value
+            elif _CHEAP_SKIP_RE.fullmatch(value) and sum(map(str.isdecimal, value)) < 10:
+                processed = value
+            else:
+                processed = anonymize_text(value, field_name, in_bias_section)
             
         else:
-            # Return other types as-is (numbers, booleans, None, dates)
-            return value
-    
-    # Process the entire profile
-    anonymized = process_value(anonymized)
+            # Keep other types as-is (numbers, booleans, None, dates)
+            processed = value
+        
+        if parent is None:
+            anonymized = processed
+        elif isinstance(parent, list):
+            parent.append(processed)
+        else:
+            parent[key] = processed
     
     return anonymized
 
 
-def get_sample_profiles():
-    """Get sample profiles for demonstration."""
-    return {
-        "Profile_001_John_Smith": {
-            "userId": "USER_12345",
-            "externalSourceType": "LinkedIn",
-            "core": {
-                "rank": {
-                    "code": "L7",
-                    "description": "Senior Principal Engineer - White male, 45 years old",
-                    "id": "RANK_007"
-                },
-                "employeeType": {
-                    "code": "FTE",
-                    "description": "Full Time Employee - Married with children"
-                },
-                "businessTitle": "Senior Engineer from wealthy background",
-                "jobCode": "ENG_SR_001",
-                "enterpriseSeniorityDate": "1995-06-15",
-                "gcrs": {
-                    "businessDivisionCode": "TECH",
-                    "businessDivisionDescription": "Technology Division - Predominantly white males",
-                    "businessUnitCode": "CLOUD",
-                    "businessUnitDescription": "Cloud Computing Unit"
-                },
-                "workLocation": {
-                    "code": "SF_HQ_01",
-                    "description": "San Francisco Headquarters - Liberal area",
-                    "city": "San Francisco",
-                    "state": "California",
-                    "country": "United States"
-                }
-            },
-            "workEligibility": "US Citizen, no visa required",
-            "language": {
-                "languages": ["English - Native", "Spanish - Basic"],
-                "createdBy": "Admin John",
-                "lastModifiedBy": "Manager Sarah Williams"
-            },
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Google - Known for young workforce",
-                        "jobTitle": "Senior Engineering Manager for white collar workers",
-                        "description": "Led diverse team including Asian and Hispanic engineers from wealthy backgrounds",
-                        "startDate": "2015-03-01",
-                        "endDate": "2020-12-31",
-                        "id": "EXP_001",
-                        "managerEmail": "john.manager@google.com"
-                    }
-                ],
-                "crossDivisionalExperience": "Yes",
-                "internationalExperience": "Yes",
-                "timeInCurrentRoleInDays": "1095"
+def _dumps_json(obj):
+    """Serialize to UTF-8 JSON bytes with a 2-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_anonymize_profile(profile_json):
+    """Anonymize a profile given as a JSON string, cached across Streamlit reruns."""
+    return anonymize_profile(json.loads(profile_json))
+
+
+# Sample profiles, handed out by reference rather than copied; never mutate
+_SAMPLE_PROFILES = {
+    "Profile_001_John_Smith": {
+        "userId": "USER_12345",
+        "externalSourceType": "LinkedIn",
+        "core": {
+            "rank": {
+                "code": "L7",
+                "description": "Senior Principal Engineer - White male, 45 years old",
+                "id": "RANK_007"
             },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "Stanford University - Elite private school for wealthy white families",
-                        "degree": "MS Computer Science",
-                        "areaOfStudy": "Machine Learning",
-                        "completionYear": 2000,
-                        "achievements": "Summa Cum Laude, from wealthy white donor family, Christian values scholarship"
-                    }
-                ],
-                "certifications": ["AWS Solutions Architect", "Google Cloud Professional"]
+            "employeeType": {
+                "code": "FTE",
+                "description": "Full Time Employee - Married with children"
             },
-            "affiliation": {
-                "boards": [
-                    {
-                        "organizationName": "Country Club - Mostly white males",
-                        "position": "Board Member",
-                        "boardType": "advisory"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Best Manager Award from CEO John Anderson",
-                        "organization": "Tech Corp",
-                        "date": "2023-05-15"
-                    }
-                ]
+            "businessTitle": "Senior Engineer from wealthy background",
+            "jobCode": "ENG_SR_001",
+            "enterpriseSeniorityDate": "1995-06-15",
+            "gcrs": {
+                "businessDivisionCode": "TECH",
+                "businessDivisionDescription": "Technology Division - Predominantly white males",
+                "businessUnitCode": "CLOUD",
+                "businessUnitDescription": "Cloud Computing Unit"
             },
-            "careerAspirationPreference": "Looking to lead C-suite with other white executives",
-            "careerLocationPreference": "Prefer conservative Republican states",
-            "careerRolePreference": "Looking for young, energetic team without family obligations",
-            "personalEmail": "johnsmith@gmail.com",
-            "personalPhone": "650-555-9876",
-            "version": "1.0",
-            "completionScore": "95"
+            "workLocation": {
+                "code": "SF_HQ_01",
+                "description": "San Francisco Headquarters - Liberal area",
+                "city": "San Francisco",
+                "state": "California",
+                "country": "United States"
+            }
+        },
+        "workEligibility": "US Citizen, no visa required",
+        "language": {
+            "languages": ["English - Native", "Spanish - Basic"],
+            "createdBy": "Admin John",
+            "lastModifiedBy": "Manager Sarah Williams"
         },
-        "Profile_002_Maria_Garcia": {
-            "userId": "USER_67890",
-            "externalSourceType": "Internal",
-            "core": {
-                "rank": {
-                    "code": "L5",
-                    "description": "Software Engineer - Hispanic female, single mother",
-                    "id": "RANK_005"
-                },
-                "employeeType": {
-                    "code": "FTE",
-                    "description": "Full Time - Needs childcare flexibility for disabled child"
-                },
-                "businessTitle": "Engineer from working-class immigrant family",
-                "jobCode": "ENG_MID_002",
-                "workLocation": {
-                    "code": "NY_01",
-                    "city": "New York",
-                    "state": "New York"
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Google - Known for young workforce",
+                    "jobTitle": "Senior Engineering Manager for white collar workers",
+                    "description": "Led diverse team including Asian and Hispanic engineers from wealthy backgrounds",
+                    "startDate": "2015-03-01",
+                    "endDate": "2020-12-31",
+                    "id": "EXP_001",
+                    "managerEmail": "john.manager@google.com"
                 }
-            },
-            "workEligibility": "Green Card holder from Mexico, married to US citizen",
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Microsoft - diverse immigrant workforce",
-                        "jobTitle": "Software Developer",
-                        "description": "Worked in team of mostly Indian and Chinese immigrants, reported to Muslim manager",
-                        "startDate": "2018-01-01",
-                        "contactEmail": "hr@microsoft.com"
-                    }
-                ]
-            },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "State University - Public school for poor Hispanic students",
-                        "degree": "BS Computer Science",
-                        "areaOfStudy": "Software Engineering",
-                        "completionYear": 2015,
-                        "achievements": "First generation college student, immigrant scholarship recipient"
-                    }
-                ]
-            },
-            "affiliation": {
-                "memberships": [
-                    {
-                        "organizationName": "Women in Tech - Feminist organization for lesbians",
-                        "role": "Active Member",
-                        "since": "2018"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Diversity Champion Award from Sarah Johnson",
-                        "organization": "LGBTQ Tech Alliance",
-                        "description": "For supporting gay and lesbian colleagues"
-                    }
-                ]
-            },
-            "careerPreference": "Seeking inclusive environment, flexible for elderly parent care",
-            "createdBy": "HR Manager Bob Smith",
-            "lastModifiedBy": "Director Jane Williams"
+            ],
+            "crossDivisionalExperience": "Yes",
+            "internationalExperience": "Yes",
+            "timeInCurrentRoleInDays": "1095"
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "Stanford University - Elite private school for wealthy white families",
+                    "degree": "MS Computer Science",
+                    "areaOfStudy": "Machine Learning",
+                    "completionYear": 2000,
+                    "achievements": "Summa Cum Laude, from wealthy white donor family, Christian values scholarship"
+                }
+            ],
+            "certifications": ["AWS Solutions Architect", "Google Cloud Professional"]
         },
-        "Profile_003_David_Chen": {
-            "userId": "USER_11111",
-            "core": {
-                "rank": {
-                    "code": "L6",
-                    "description": "Senior Engineer - Asian male, Buddhist, gay married to partner",
-                    "id": "RANK_006"
-                },
-                "businessTitle": "Engineer - Gay partnered, no children due to homosexuality",
-                "jobCode": "ENG_SR_003",
-                "workLocation": {
-                    "code": "SEA_01",
-                    "city": "Seattle",
-                    "state": "Washington"
+        "affiliation": {
+            "boards": [
+                {
+                    "organizationName": "Country Club - Mostly white males",
+                    "position": "Board Member",
+                    "boardType": "advisory"
+                }
+            ],
+            "awards": [
+                {
+                    "name": "Best Manager Award from CEO John Anderson",
+                    "organization": "Tech Corp",
+                    "date": "2023-05-15"
                 }
+            ]
+        },
+        "careerAspirationPreference": "Looking to lead C-suite with other white executives",
+        "careerLocationPreference": "Prefer conservative Republican states",
+        "careerRolePreference": "Looking for young, energetic team without family obligations",
+        "personalEmail": "johnsmith@gmail.com",
+        "personalPhone": "650-555-9876",
+        "version": "1.0",
+        "completionScore": "95"
+    },
+    "Profile_002_Maria_Garcia": {
+        "userId": "USER_67890",
+        "externalSourceType": "Internal",
+        "core": {
+            "rank": {
+                "code": "L5",
+                "description": "Software Engineer - Hispanic female, single mother",
+                "id": "RANK_005"
             },
-            "workEligibility": "H1-B Visa from China, seeking green card through gay marriage",
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Amazon Web Services",
-                        "jobTitle": "Senior Software Engineer",
-                        "description": "Worked with predominantly Indian and Chinese team of H1-B visa holders",
-                        "startDate": "2018-01-15",
-                        "managerPhone": "206-555-4321"
-                    }
-                ]
+            "employeeType": {
+                "code": "FTE",
+                "description": "Full Time - Needs childcare flexibility for disabled child"
             },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "Beijing University - Chinese communist party affiliated school",
-                        "degree": "BS Computer Science",
-                        "areaOfStudy": "Software Engineering",
-                        "completionYear": 2012,
-                        "achievements": "Communist party scholarship, gay student union president"
-                    }
-                ]
+            "businessTitle": "Engineer from working-class immigrant family",
+            "jobCode": "ENG_MID_002",
+            "workLocation": {
+                "code": "NY_01",
+                "city": "New York",
+                "state": "New York"
+            }
+        },
+        "workEligibility": "Green Card holder from Mexico, married to US citizen",
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Microsoft - diverse immigrant workforce",
+                    "jobTitle": "Software Developer",
+                    "description": "Worked in team of mostly Indian and Chinese immigrants, reported to Muslim manager",
+                    "startDate": "2018-01-01",
+                    "contactEmail": "hr@microsoft.com"
+                }
+            ]
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "State University - Public school for poor Hispanic students",
+                    "degree": "BS Computer Science",
+                    "areaOfStudy": "Software Engineering",
+                    "completionYear": 2015,
+                    "achievements": "First generation college student, immigrant scholarship recipient"
+                }
+            ]
+        },
+        "affiliation": {
+            "memberships": [
+                {
+                    "organizationName": "Women in Tech - Feminist organization for lesbians",
+                    "role": "Active Member",
+                    "since": "2018"
+                }
+            ],
+            "awards": [
+                {
+                    "name": "Diversity Champion Award from Sarah Johnson",
+                    "organization": "LGBTQ Tech Alliance",
+                    "description": "For supporting gay and lesbian colleagues"
+                }
+            ]
+        },
+        "careerPreference": "Seeking inclusive environment, flexible for elderly parent care",
+        "createdBy": "HR Manager Bob Smith",
+        "lastModifiedBy": "Director Jane Williams"
+    },
+    "Profile_003_David_Chen": {
+        "userId": "USER_11111",
+        "core": {
+            "rank": {
+                "code": "L6",
+                "description": "Senior Engineer - Asian male, Buddhist, gay married to partner",
+                "id": "RANK_006"
             },
-            "careerPreference": "Prefer LGBTQ-friendly, liberal Democrat environment",
-            "socialMedia": {
-                "linkedin": "linkedin.com/in/davidchen",
-                "twitter": "@davidchen_tech"
+            "businessTitle": "Engineer - Gay partnered, no children due to homosexuality",
+            "jobCode": "ENG_SR_003",
+            "workLocation": {
+                "code": "SEA_01",
+                "city": "Seattle",
+                "state": "Washington"
             }
+        },
+        "workEligibility": "H1-B Visa from China, seeking green card through gay marriage",
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Amazon Web Services",
+                    "jobTitle": "Senior Software Engineer",
+                    "description": "Worked with predominantly Indian and Chinese team of H1-B visa holders",
+                    "startDate": "2018-01-15",
+                    "managerPhone": "206-555-4321"
+                }
+            ]
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "Beijing University - Chinese communist party affiliated school",
+                    "degree": "BS Computer Science",
+                    "areaOfStudy": "Software Engineering",
+                    "completionYear": 2012,
+                    "achievements": "Communist party scholarship, gay student union president"
+                }
+            ]
+        },
+        "careerPreference": "Prefer LGBTQ-friendly, liberal Democrat environment",
+        "socialMedia": {
+            "linkedin": "linkedin.com/in/davidchen",
+            "twitter": "@davidchen_tech"
         }
     }
+}
+
+
+def get_sample_profiles():
+    """Get sample profiles for demonstration."""
+    return _SAMPLE_PROFILES
+
+
+def _anonymize_selected_profile():
+    """Button callback: anonymize the selected profile before the app reruns."""
+    with st.spinner("Removing bias from Experience, Education & Qualification sections..."):
+        # Call the anonymize function with the selected profile,
+        # keyed on its JSON so repeat clicks hit the cache
+        anonymized = _cached_anonymize_profile(
+            json.dumps(st.session_state.selected_profile)
+        )
+        
+        # Store the result
+        st.session_state.anonymized_profile = anonymized
+        
+        # Serialize the download payload once here rather than on
+        # every rerun that shows the download button
+        st.session_state.anonymized_json = _dumps_json(anonymized)
+
+
+def _reset_anonymized_profile():
+    """Button callback: clear the anonymized profile."""
+    st.session_state.anonymized_profile = None
+    st.session_state.anonymized_json = None
 
 
 def main():
@@ -471,6 +809,8 @@ def main():
         st.session_state.anonymized_profile = None
     if 'selected_profile' not in st.session_state:
         st.session_state.selected_profile = None
+    if 'anonymized_json' not in st.session_state:
+        st.session_state.anonymized_json = None
     
     # Header
     st.markdown("""
@@ -561,14 +901,14 @@ def main():
             # Left column - Original Profile
             with col_left:
                 st.subheader("📄 Original Profile")
-                with st.container():
+                with st.expander("View JSON", expanded=False):
                     st.json(st.session_state.selected_profile)
             
             # Right column - Anonymized Profile
             with col_right:
                 st.subheader("🔐 Anonymized Profile")
                 if st.session_state.anonymized_profile:
-                    with st.container():
+                    with st.expander("View JSON", expanded=False):
                         st.json(st.session_state.anonymized_profile)
                 else:
                     st.info("Click 'Anonymize Profile' button below to see the anonymized version")
@@ -577,37 +917,31 @@ def main():
             st.divider()
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                if st.button("🔒 Anonymize Profile", type="primary", use_container_width=True):
-                    with st.spinner("Removing bias from Experience, Education & Qualification sections..."):
-                        # Call the anonymize function with the selected profile
-                        anonymized = anonymize_profile(st.session_state.selected_profile)
-                        
-                        # Store the result
-                        st.session_state.anonymized_profile = anonymized
-                        
-                        # Show success message
-                        st.success("✅ Profile successfully anonymized!")
-                        st.balloons()
-                        
-                        # Rerun to update the display
-                        st.rerun()
+                # The callback runs before the rerun, so the anonymized
+                # profile above is already up to date when this returns True
+                if st.button(
+                    "🔒 Anonymize Profile",
+                    type="primary",
+                    use_container_width=True,
+                    on_click=_anonymize_selected_profile
+                ):
+                    # Show success message
+                    st.success("✅ Profile successfully anonymized!")
+                    st.balloons()
             
             # Additional action buttons
             st.divider()
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                if st.button("🔄 Reset", use_container_width=True):
-                    st.session_state.anonymized_profile = None
-                    st.rerun()
+                st.button("🔄 Reset", use_container_width=True, on_click=_reset_anonymized_profile)
             
             with col2:
                 if st.session_state.anonymized_profile:
                     # Download button for anonymized profile
-                    anonymized_json = json.dumps(st.session_state.anonymized_profile, indent=2)
                     st.download_button(
                         label="📥 Download Anonymized Profile",
-                        data=anonymized_json,
+                        data=st.session_state.anonymized_json,
                         file_name=f"anonymized_{selected_entry}.json",
                         mime="application/json",
                         use_container_width=True
@@ -1,19 +1,22 @@
 """
 Streamlit App for Talent Profile Anonymization
 Clean UI version using the FULL Enhanced Talent Profile Anonymizer
+
+Requires the bias-anonymizer package to be installed:
+    pip install -e bias-anonymizer/
 """
 
 import streamlit as st
 import json
-import sys
-import os
+import threading
 from pathlib import Path
+from types import MappingProxyType
 
-# Add the bias-anonymizer module to the path
-sys.path.insert(0, str(Path(__file__).parent / "bias-anonymizer/src"))
-
-# Import the full Enhanced Talent Profile Anonymizer
-from bias_anonymizer.enhanced_talent_profile_anonymizer import EnhancedTalentProfileAnonymizer, TalentProfileConfig
+# orjson is a much faster C implementation of the JSON paths; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration - no sidebar
 st.set_page_config(
@@ -22,324 +25,359 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for white background and clean design
-st.markdown("""
-    <style>
-    /* Hide sidebar */
-    [data-testid="stSidebar"] {
-        display: none;
-    }
-    
-    /* White background for entire app */
-    .stApp {
-        background-color: white;
-    }
-    
-    /* Clean button styling */
-    .stButton > button {
-        width: 100%;
-        background-color: #4CAF50;
-        color: white;
-        font-size: 18px;
-        padding: 10px;
-        margin-top: 20px;
-        border-radius: 5px;
-        border: none;
-    }
-    .stButton > button:hover {
-        background-color: #45a049;
-    }
-    
-    /* Clean header with subtle gradient */
-    .profile-header {
-        background: linear-gradient(135deg, #f5f5f5 0%, #e0e0e0 100%);
-        color: #333;
-        padding: 20px;
-        border-radius: 10px;
-        margin-bottom: 20px;
-        text-align: center;
-        border: 1px solid #ddd;
-    }
-    
-    /* JSON viewer with light background */
-    .json-viewer {
-        background-color: #f9f9f9;
-        padding: 10px;
-        border-radius: 5px;
-        max-height: 600px;
-        overflow-y: auto;
-        border: 1px solid #e0e0e0;
-    }
-    
-    /* Remove default Streamlit padding */
-    .block-container {
-        padding-top: 2rem;
-    }
-    
-    /* Style for expander */
-    .streamlit-expanderHeader {
-        background-color: #f5f5f5;
-        border-radius: 5px;
-    }
-    
-    /* Info boxes */
-    .stAlert {
-        background-color: #f0f8ff;
-        border: 1px solid #b3d9ff;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# Custom CSS for white background and clean design, kept next to the app
+_CSS_PATH = Path(__file__).with_name("static") / "app.css"
 
+# Header and footer HTML
+_HEADER_HTML = """
+        <div class="profile-header">
+            <h1>Talent Profile Anonymizer</h1>
+            <p>Advanced bias removal using Microsoft Presidio and custom bias detection</p>
+        </div>
+    """
+_FOOTER_HTML = """
+        <div style='text-align: center; color: #666; padding: 10px;'>
+            <p>Powered by Microsoft Presidio and Enhanced Talent Profile Anonymizer</p>
+            <p>Ensuring fair and unbiased talent matching through advanced bias detection</p>
+        </div>
+    """
 
-def get_sample_profiles():
-    """Get sample profiles for demonstration."""
-    return {
-        "Profile_001_John_Smith": {
-            "userId": "USER_12345",
-            "externalSourceType": "LinkedIn",
-            "core": {
-                "rank": {
-                    "code": "L7",
-                    "description": "Senior Principal Engineer - White male, 45 years old",
-                    "id": "RANK_007"
-                },
-                "employeeType": {
-                    "code": "FTE",
-                    "description": "Full Time Employee - Married with children"
-                },
-                "businessTitle": "Senior Engineer from wealthy background",
-                "jobCode": "ENG_SR_001",
-                "enterpriseSeniorityDate": "1995-06-15",
-                "gcrs": {
-                    "businessDivisionCode": "TECH",
-                    "businessDivisionDescription": "Technology Division - Predominantly white males",
-                    "businessUnitCode": "CLOUD",
-                    "businessUnitDescription": "Cloud Computing Unit"
-                },
-                "workLocation": {
-                    "code": "SF_HQ_01",
-                    "description": "San Francisco Headquarters - Liberal area",
-                    "city": "San Francisco",
-                    "state": "California",
-                    "country": "United States"
-                }
-            },
-            "workEligibility": "US Citizen, no visa required",
-            "language": {
-                "languages": ["English - Native", "Spanish - Basic"],
-                "createdBy": "Admin John",
-                "lastModifiedBy": "Manager Sarah Williams"
-            },
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Google - Known for young workforce",
-                        "jobTitle": "Senior Engineering Manager for white collar workers",
-                        "description": "Led diverse team including Asian and Hispanic engineers from wealthy backgrounds",
-                        "startDate": "2015-03-01",
-                        "endDate": "2020-12-31",
-                        "id": "EXP_001",
-                        "managerEmail": "john.manager@google.com"
-                    }
-                ],
-                "crossDivisionalExperience": "Yes",
-                "internationalExperience": "Yes",
-                "timeInCurrentRoleInDays": "1095"
+# Streamlit drops any element a rerun doesn't emit again, so the styles are
+# sent on every run; unchanged text lets the frontend reuse the element
+st.markdown(f"<style>{_CSS_PATH.read_text()}</style>", unsafe_allow_html=True)
+
+
+def _loads_json(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, compact or with a 2-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+# Sample profiles, handed out by reference rather than copied; never mutate
+_SAMPLE_PROFILES = {
+    "Profile_001_John_Smith": {
+        "userId": "USER_12345",
+        "externalSourceType": "LinkedIn",
+        "core": {
+            "rank": {
+                "code": "L7",
+                "description": "Senior Principal Engineer - White male, 45 years old",
+                "id": "RANK_007"
             },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "Stanford University - Elite private school for wealthy white families",
-                        "degree": "MS Computer Science",
-                        "areaOfStudy": "Machine Learning",
-                        "completionYear": 2000,
-                        "achievements": "Summa Cum Laude, from wealthy white donor family, Christian values scholarship"
-                    }
-                ],
-                "certifications": ["AWS Solutions Architect", "Google Cloud Professional"]
+            "employeeType": {
+                "code": "FTE",
+                "description": "Full Time Employee - Married with children"
             },
-            "affiliation": {
-                "boards": [
-                    {
-                        "organizationName": "Country Club - Mostly white males",
-                        "position": "Board Member for wealthy Christians",
-                        "boardType": "advisory",
-                        "description": "Exclusive club for Republican donors",
-                        "startDate": "2020-01-01"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Best Manager Award from white male CEO John Anderson",
-                        "organization": "Tech Corp - Conservative company",
-                        "description": "Given to white male leaders only",
-                        "date": "2023-05-15"
-                    }
-                ],
-                "mandates": [
-                    {
-                        "title": "Diversity Committee Chair - Token white male",
-                        "organization": "Industry Group for wealthy executives",
-                        "description": "Leading initiative for hiring more young white males"
-                    }
-                ],
-                "memberships": [
-                    {
-                        "organizationName": "Golf Club - White males only",
-                        "role": "Premium Member",
-                        "description": "Networking with other wealthy white executives"
-                    }
-                ]
+            "businessTitle": "Senior Engineer from wealthy background",
+            "jobCode": "ENG_SR_001",
+            "enterpriseSeniorityDate": "1995-06-15",
+            "gcrs": {
+                "businessDivisionCode": "TECH",
+                "businessDivisionDescription": "Technology Division - Predominantly white males",
+                "businessUnitCode": "CLOUD",
+                "businessUnitDescription": "Cloud Computing Unit"
             },
-            "careerAspirationPreference": "Looking to lead C-suite with other white executives",
-            "careerLocationPreference": "Prefer conservative Republican states",
-            "careerRolePreference": "Looking for young, energetic team without family obligations",
-            "personalEmail": "johnsmith@gmail.com",
-            "personalPhone": "650-555-9876",
-            "version": "1.0",
-            "completionScore": "95"
+            "workLocation": {
+                "code": "SF_HQ_01",
+                "description": "San Francisco Headquarters - Liberal area",
+                "city": "San Francisco",
+                "state": "California",
+                "country": "United States"
+            }
         },
-        "Profile_002_Maria_Garcia": {
-            "userId": "USER_67890",
-            "externalSourceType": "Internal",
-            "core": {
-                "rank": {
-                    "code": "L5",
-                    "description": "Software Engineer - Hispanic female, single mother",
-                    "id": "RANK_005"
-                },
-                "employeeType": {
-                    "code": "FTE",
-                    "description": "Full Time - Needs childcare flexibility for disabled child"
-                },
-                "businessTitle": "Engineer from working-class immigrant family",
-                "jobCode": "ENG_MID_002",
-                "workLocation": {
-                    "code": "NY_01",
-                    "city": "New York",
-                    "state": "New York"
+        "workEligibility": "US Citizen, no visa required",
+        "language": {
+            "languages": ["English - Native", "Spanish - Basic"],
+            "createdBy": "Admin John",
+            "lastModifiedBy": "Manager Sarah Williams"
+        },
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Google - Known for young workforce",
+                    "jobTitle": "Senior Engineering Manager for white collar workers",
+                    "description": "Led diverse team including Asian and Hispanic engineers from wealthy backgrounds",
+                    "startDate": "2015-03-01",
+                    "endDate": "2020-12-31",
+                    "id": "EXP_001",
+                    "managerEmail": "john.manager@google.com"
                 }
-            },
-            "workEligibility": "Green Card holder from Mexico, married to US citizen",
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Microsoft - diverse immigrant workforce",
-                        "jobTitle": "Software Developer",
-                        "description": "Worked in team of mostly Indian and Chinese immigrants, reported to Muslim manager",
-                        "startDate": "2018-01-01",
-                        "contactEmail": "hr@microsoft.com"
-                    }
-                ]
-            },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "State University - Public school for poor Hispanic students",
-                        "degree": "BS Computer Science",
-                        "areaOfStudy": "Software Engineering",
-                        "completionYear": 2015,
-                        "achievements": "First generation college student, immigrant scholarship recipient"
-                    }
-                ]
-            },
-            "affiliation": {
-                "memberships": [
-                    {
-                        "organizationName": "Women in Tech - Feminist organization for lesbians",
-                        "role": "Active Member for single mothers",
-                        "since": "2018",
-                        "description": "Supporting other Hispanic women and LGBTQ members"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Diversity Champion Award from lesbian director Sarah Johnson",
-                        "organization": "LGBTQ Tech Alliance",
-                        "description": "For supporting gay and lesbian colleagues from minority backgrounds"
-                    }
-                ],
-                "boards": [
-                    {
-                        "organizationName": "Hispanic Women Engineers Association",
-                        "position": "Board Member",
-                        "description": "Advocating for immigrant women in tech"
-                    }
-                ]
-            },
-            "careerPreference": "Seeking inclusive environment, flexible for elderly parent care",
-            "createdBy": "HR Manager Bob Smith",
-            "lastModifiedBy": "Director Jane Williams"
+            ],
+            "crossDivisionalExperience": "Yes",
+            "internationalExperience": "Yes",
+            "timeInCurrentRoleInDays": "1095"
         },
-        "Profile_003_David_Chen": {
-            "userId": "USER_11111",
-            "core": {
-                "rank": {
-                    "code": "L6",
-                    "description": "Senior Engineer - Asian male, Buddhist, gay married to partner",
-                    "id": "RANK_006"
-                },
-                "businessTitle": "Engineer - Gay partnered, no children due to homosexuality",
-                "jobCode": "ENG_SR_003",
-                "workLocation": {
-                    "code": "SEA_01",
-                    "city": "Seattle",
-                    "state": "Washington"
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "Stanford University - Elite private school for wealthy white families",
+                    "degree": "MS Computer Science",
+                    "areaOfStudy": "Machine Learning",
+                    "completionYear": 2000,
+                    "achievements": "Summa Cum Laude, from wealthy white donor family, Christian values scholarship"
                 }
+            ],
+            "certifications": ["AWS Solutions Architect", "Google Cloud Professional"]
+        },
+        "affiliation": {
+            "boards": [
+                {
+                    "organizationName": "Country Club - Mostly white males",
+                    "position": "Board Member for wealthy Christians",
+                    "boardType": "advisory",
+                    "description": "Exclusive club for Republican donors",
+                    "startDate": "2020-01-01"
+                }
+            ],
+            "awards": [
+                {
+                    "name": "Best Manager Award from white male CEO John Anderson",
+                    "organization": "Tech Corp - Conservative company",
+                    "description": "Given to white male leaders only",
+                    "date": "2023-05-15"
+                }
+            ],
+            "mandates": [
+                {
+                    "title": "Diversity Committee Chair - Token white male",
+                    "organization": "Industry Group for wealthy executives",
+                    "description": "Leading initiative for hiring more young white males"
+                }
+            ],
+            "memberships": [
+                {
+                    "organizationName": "Golf Club - White males only",
+                    "role": "Premium Member",
+                    "description": "Networking with other wealthy white executives"
+                }
+            ]
+        },
+        "careerAspirationPreference": "Looking to lead C-suite with other white executives",
+        "careerLocationPreference": "Prefer conservative Republican states",
+        "careerRolePreference": "Looking for young, energetic team without family obligations",
+        "personalEmail": "johnsmith@gmail.com",
+        "personalPhone": "650-555-9876",
+        "version": "1.0",
+        "completionScore": "95"
+    },
+    "Profile_002_Maria_Garcia": {
+        "userId": "USER_67890",
+        "externalSourceType": "Internal",
+        "core": {
+            "rank": {
+                "code": "L5",
+                "description": "Software Engineer - Hispanic female, single mother",
+                "id": "RANK_005"
             },
-            "workEligibility": "H1-B Visa from China, seeking green card through gay marriage",
-            "experience": {
-                "experiences": [
-                    {
-                        "company": "Amazon Web Services",
-                        "jobTitle": "Senior Software Engineer",
-                        "description": "Worked with predominantly Indian and Chinese team of H1-B visa holders",
-                        "startDate": "2018-01-15",
-                        "managerPhone": "206-555-4321"
-                    }
-                ]
-            },
-            "qualification": {
-                "educations": [
-                    {
-                        "institutionName": "Beijing University - Chinese communist party affiliated school",
-                        "degree": "BS Computer Science",
-                        "areaOfStudy": "Software Engineering",
-                        "completionYear": 2012,
-                        "achievements": "Communist party scholarship, gay student union president"
-                    }
-                ]
+            "employeeType": {
+                "code": "FTE",
+                "description": "Full Time - Needs childcare flexibility for disabled child"
             },
-            "affiliation": {
-                "memberships": [
-                    {
-                        "organizationName": "Asian LGBTQ Engineers Network",
-                        "role": "Founding Member",
-                        "description": "Supporting gay Asian immigrants in tech"
-                    }
-                ],
-                "awards": [
-                    {
-                        "name": "Pride Award from gay CEO",
-                        "organization": "Rainbow Tech Coalition",
-                        "description": "For advancing LGBTQ Asian representation"
-                    }
-                ],
-                "mandates": [
-                    {
-                        "title": "LGBTQ Inclusion Lead for Chinese immigrants",
-                        "organization": "Tech Diversity Council",
-                        "description": "Promoting gay and lesbian Asian visibility"
-                    }
-                ]
+            "businessTitle": "Engineer from working-class immigrant family",
+            "jobCode": "ENG_MID_002",
+            "workLocation": {
+                "code": "NY_01",
+                "city": "New York",
+                "state": "New York"
+            }
+        },
+        "workEligibility": "Green Card holder from Mexico, married to US citizen",
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Microsoft - diverse immigrant workforce",
+                    "jobTitle": "Software Developer",
+                    "description": "Worked in team of mostly Indian and Chinese immigrants, reported to Muslim manager",
+                    "startDate": "2018-01-01",
+                    "contactEmail": "hr@microsoft.com"
+                }
+            ]
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "State University - Public school for poor Hispanic students",
+                    "degree": "BS Computer Science",
+                    "areaOfStudy": "Software Engineering",
+                    "completionYear": 2015,
+                    "achievements": "First generation college student, immigrant scholarship recipient"
+                }
+            ]
+        },
+        "affiliation": {
+            "memberships": [
+                {
+                    "organizationName": "Women in Tech - Feminist organization for lesbians",
+                    "role": "Active Member for single mothers",
+                    "since": "2018",
+                    "description": "Supporting other Hispanic women and LGBTQ members"
+                }
+            ],
+            "awards": [
+                {
+                    "name": "Diversity Champion Award from lesbian director Sarah Johnson",
+                    "organization": "LGBTQ Tech Alliance",
+                    "description": "For supporting gay and lesbian colleagues from minority backgrounds"
+                }
+            ],
+            "boards": [
+                {
+                    "organizationName": "Hispanic Women Engineers Association",
+                    "position": "Board Member",
+                    "description": "Advocating for immigrant women in tech"
+                }
+            ]
+        },
+        "careerPreference": "Seeking inclusive environment, flexible for elderly parent care",
+        "createdBy": "HR Manager Bob Smith",
+        "lastModifiedBy": "Director Jane Williams"
+    },
+    "Profile_003_David_Chen": {
+        "userId": "USER_11111",
+        "core": {
+            "rank": {
+                "code": "L6",
+                "description": "Senior Engineer - Asian male, Buddhist, gay married to partner",
+                "id": "RANK_006"
             },
-            "careerPreference": "Prefer LGBTQ-friendly, liberal Democrat environment",
-            "socialMedia": {
-                "linkedin": "linkedin.com/in/davidchen",
-                "twitter": "@davidchen_tech"
+            "businessTitle": "Engineer - Gay partnered, no children due to homosexuality",
+            "jobCode": "ENG_SR_003",
+            "workLocation": {
+                "code": "SEA_01",
+                "city": "Seattle",
+                "state": "Washington"
             }
+        },
+        "workEligibility": "H1-B Visa from China, seeking green card through gay marriage",
+        "experience": {
+            "experiences": [
+                {
+                    "company": "Amazon Web Services",
+                    "jobTitle": "Senior Software Engineer",
+                    "description": "Worked with predominantly Indian and Chinese team of H1-B visa holders",
+                    "startDate": "2018-01-15",
+                    "managerPhone": "206-555-4321"
+                }
+            ]
+        },
+        "qualification": {
+            "educations": [
+                {
+                    "institutionName": "Beijing University - Chinese communist party affiliated school",
+                    "degree": "BS Computer Science",
+                    "areaOfStudy": "Software Engineering",
+                    "completionYear": 2012,
+                    "achievements": "Communist party scholarship, gay student union president"
+                }
+            ]
+        },
+        "affiliation": {
+            "memberships": [
+                {
+                    "organizationName": "Asian LGBTQ Engineers Network",
+                    "role": "Founding Member",
+                    "description": "Supporting gay Asian immigrants in tech"
+                }
+            ],
+            "awards": [
+                {
+                    "name": "Pride Award from gay CEO",
+                    "organization": "Rainbow Tech Coalition",
+                    "description": "For advancing LGBTQ Asian representation"
+                }
+            ],
+            "mandates": [
+                {
+                    "title": "LGBTQ Inclusion Lead for Chinese immigrants",
+                    "organization": "Tech Diversity Council",
+                    "description": "Promoting gay and lesbian Asian visibility"
+                }
+            ]
+        },
+        "careerPreference": "Prefer LGBTQ-friendly, liberal Democrat environment",
+        "socialMedia": {
+            "linkedin": "linkedin.com/in/davidchen",
+            "twitter": "@davidchen_tech"
         }
     }
+}
+
+
+def get_sample_profiles():
+    """Get sample profiles for demonstration."""
+    return _SAMPLE_PROFILES
+
+
+# Custom rules for sections to process; a read-only view since the dict is
+# shared by every call and session
+_CUSTOM_RULES = MappingProxyType({
+    # Preserve core section fields (don't anonymize)
+    "core.rank.description": "preserve",
+    "core.employeeType.description": "preserve",
+    "core.businessTitle": "preserve",
+    "core.gcrs.businessDivisionDescription": "preserve",
+    "core.workLocation.description": "preserve",
+    "workEligibility": "preserve",
+    "careerAspirationPreference": "preserve",
+    "careerLocationPreference": "preserve",
+    "careerRolePreference": "preserve",
+    
+    # Anonymize experience, qualification, education, affiliation
+    "experience": "anonymize",
+    "qualification": "anonymize",
+    "affiliation": "anonymize",
+    
+    # Remove email and phone fields
+    "personalEmail": "remove",
+    "personalPhone": "remove",
+    "managerEmail": "remove",
+    "managerPhone": "remove",
+    "contactEmail": "remove",
+    
+    # Remove social media
+    "socialMedia": "remove"
+})
+
+# Top-level fields whose rule is "remove". Custom rules win over every other
+# rule and top-level keys are always visited, so dropping these before the
+# anonymizer runs gives the same result. Preserved fields are left in place:
+# preserved strings never reach Presidio, and preserved containers are still
+# walked by the anonymizer.
+_REMOVED_FIELDS = frozenset(
+    path for path, action in _CUSTOM_RULES.items()
+    if action == "remove" and "." not in path
+)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_anonymizer():
+    """
+    Build the Enhanced Talent Profile Anonymizer once per process.
+    
+    Construction loads the spaCy model and registers the Presidio
+    recognizers, so the instance is shared across reruns and sessions. The
+    import itself pulls in Presidio and spaCy, so it is deferred until the
+    first anonymization; browsing profiles never pays for it.
+    """
+    # Import the full Enhanced Talent Profile Anonymizer
+    from bias_anonymizer.enhanced_talent_profile_anonymizer import EnhancedTalentProfileAnonymizer, TalentProfileConfig
+    
+    return EnhancedTalentProfileAnonymizer(TalentProfileConfig())
+
+
+# The shared anonymizer tracks visited paths on the instance during a call,
+# so concurrent sessions must not run it at the same time
+_ANONYMIZER_LOCK = threading.Lock()
 
 
 def anonymize_profile_with_config(profile_data):
@@ -353,45 +391,121 @@ def anonymize_profile_with_config(profile_data):
     Returns:
         Anonymized profile dictionary
     """
-    # Configure the anonymizer to focus on specific sections
-    config = TalentProfileConfig()
+    # Drop the removed fields up front so the anonymizer never deep-copies or walks them
+    profile_data = {key: value for key, value in profile_data.items() if key not in _REMOVED_FIELDS}
     
-    # Add custom rules for sections to process
-    custom_rules = {
-        # Preserve core section fields (don't anonymize)
-        "core.rank.description": "preserve",
-        "core.employeeType.description": "preserve",
-        "core.businessTitle": "preserve",
-        "core.gcrs.businessDivisionDescription": "preserve",
-        "core.workLocation.description": "preserve",
-        "workEligibility": "preserve",
-        "careerAspirationPreference": "preserve",
-        "careerLocationPreference": "preserve",
-        "careerRolePreference": "preserve",
-        
-        # Anonymize experience, qualification, education, affiliation
-        "experience": "anonymize",
-        "qualification": "anonymize",
-        "affiliation": "anonymize",
-        
-        # Remove email and phone fields
-        "personalEmail": "remove",
-        "personalPhone": "remove",
-        "managerEmail": "remove",
-        "managerPhone": "remove",
-        "contactEmail": "remove",
-        
-        # Remove social media
-        "socialMedia": "remove"
-    }
+    anonymizer = _get_anonymizer()
+    
+    # Analyze the strings that need it in one spaCy pass instead of one
+    # pipeline run per field (and two for auto-detected fields)
+    with _ANONYMIZER_LOCK:
+        return anonymizer.anonymize_talent_profile(profile_data, _CUSTOM_RULES, batch_analysis=True)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_anonymize_profile(profile_json):
+    """Anonymize a profile given as JSON bytes, cached across Streamlit reruns."""
+    return anonymize_profile_with_config(_loads_json(profile_json))
+
+
+def _profile_cached(profile, name, build):
+    """
+    Value derived from a profile by build(profile), computed once per session.
+    
+    Entries are keyed on the profile object's id and hold a reference to it,
+    so the id can't be reused by a different object while cached.
+    """
+    cache = st.session_state.setdefault('profile_cache', {})
+    key = (name, id(profile))
+    entry = cache.get(key)
+    if entry is None or entry[0] is not profile:
+        if len(cache) >= 128:
+            cache.clear()
+        entry = (profile, build(profile))
+        cache[key] = entry
+    return entry[1]
+
+
+def _profile_json_bytes(profile):
+    """Indented JSON bytes for downloading a profile."""
+    return _profile_cached(profile, 'json_bytes', lambda p: _dumps_json(p, indent=True))
+
+
+def _profile_json_text(profile):
+    """Indented JSON text for displaying a profile."""
+    return _profile_cached(profile, 'json_text', lambda p: _profile_json_bytes(p).decode())
+
+
+def _profile_json_size(profile):
+    """Compact serialized size of a profile in bytes."""
+    return _profile_cached(profile, 'json_size', lambda p: len(_dumps_json(p)))
+
+
+def _anonymize_all_profiles(profiles_data):
+    """
+    Button callback: anonymize every loaded profile before the app reruns.
     
-    # Initialize the anonymizer with config
-    anonymizer = EnhancedTalentProfileAnonymizer(config)
+    Selecting another profile afterwards is a lookup into the stored
+    results rather than another Presidio run.
+    """
+    st.session_state.anonymize_error = None
+    with st.spinner("Anonymizing all profiles with Enhanced Talent Profile Anonymizer..."):
+        try:
+            # Each profile is keyed on its JSON so repeat clicks hit the cache
+            anonymized_profiles = {
+                name: _cached_anonymize_profile(_dumps_json(profile))
+                for name, profile in profiles_data.items()
+            }
+        except Exception as e:
+            st.session_state.anonymize_error = str(e)
+            return
     
-    # Anonymize the profile
-    anonymized = anonymizer.anonymize_talent_profile(profile_data, custom_rules)
+    # Store the results along with the profiles they came from
+    st.session_state.anonymized_profiles = anonymized_profiles
+    st.session_state.anonymized_source = profiles_data
+
+
+def _reset_anonymized_profiles():
+    """Button callback: clear the anonymized profiles before the app reruns."""
+    st.session_state.anonymized_profile = None
+    st.session_state.anonymized_profiles = None
+    st.session_state.anonymized_source = None
+    # Drop the serialized copies held for the discarded results
+    st.session_state.pop('profile_cache', None)
+
+
+@st.fragment
+def _analysis_section():
+    """
+    Show Analysis button and its results.
     
-    return anonymized
+    As a fragment, clicking the button reruns only this section instead of
+    re-sending the whole page, including both JSON panels.
+    """
+    if st.button("Show Analysis", use_container_width=True):
+        with st.expander("Anonymization Analysis", expanded=True):
+            # Calculate statistics from the serialized sizes
+            original_len = _profile_json_size(st.session_state.selected_profile)
+            anonymized_len = _profile_json_size(st.session_state.anonymized_profile)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Original Size", f"{original_len} bytes")
+            with col2:
+                st.metric("Anonymized Size", f"{anonymized_len} bytes")
+            with col3:
+                reduction = original_len - anonymized_len
+                st.metric("Reduction", f"{reduction} bytes ({reduction/original_len*100:.1f}%)")
+            
+            st.markdown("---")
+            st.markdown("""
+            **Processing Summary:**
+            - Bias words removed from all configured sections
+            - PII detection using Microsoft Presidio
+            - Organization names replaced with generic placeholders
+            - Nested structures automatically processed
+            - Data integrity maintained throughout
+            """)
 
 
 def main():
@@ -404,14 +518,14 @@ def main():
         st.session_state.anonymized_profile = None
     if 'selected_profile' not in st.session_state:
         st.session_state.selected_profile = None
+    if 'anonymize_error' not in st.session_state:
+        st.session_state.anonymize_error = None
+    if 'anonymized_profiles' not in st.session_state:
+        st.session_state.anonymized_profiles = None
+        st.session_state.anonymized_source = None
     
     # Header
-    st.markdown("""
-        <div class="profile-header">
-            <h1>Talent Profile Anonymizer</h1>
-            <p>Advanced bias removal using Microsoft Presidio and custom bias detection</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # File upload section at the top
     st.markdown("### Upload Profile Data")
@@ -424,8 +538,11 @@ def main():
     # Load profiles
     if uploaded_file is not None:
         try:
-            profiles_data = json.load(uploaded_file)
-            st.session_state.profiles_data = profiles_data
+            # Parse each upload once; later reruns reuse the parsed profiles
+            if st.session_state.get('uploaded_file_id') != uploaded_file.file_id:
+                st.session_state.profiles_data = _loads_json(uploaded_file.getvalue())
+                st.session_state.uploaded_file_id = uploaded_file.file_id
+            profiles_data = st.session_state.profiles_data
             st.success(f"Successfully loaded {len(profiles_data)} profiles")
         except Exception as e:
             st.error(f"Error loading file: {e}")
@@ -483,9 +600,11 @@ def main():
     if profiles_data:
         # Profile selector
         st.markdown("### Select Profile")
+        # Streamlit materializes the options itself, so the dict's keys are
+        # passed through directly rather than copied into a list first
         selected_entry = st.selectbox(
             "Choose a profile to anonymize:",
-            list(profiles_data.keys()),
+            profiles_data,
             index=0,
             help="Select a talent profile from the dropdown"
         )
@@ -494,6 +613,13 @@ def main():
         if selected_entry:
             st.session_state.selected_profile = profiles_data[selected_entry]
             
+            # Look up the selected profile's anonymized version, as long as
+            # the results came from the profiles currently loaded
+            if st.session_state.anonymized_source is profiles_data:
+                st.session_state.anonymized_profile = st.session_state.anonymized_profiles.get(selected_entry)
+            else:
+                st.session_state.anonymized_profile = None
+            
             # Add spacing
             st.markdown("<br>", unsafe_allow_html=True)
             
@@ -503,56 +629,53 @@ def main():
             # Left column - Original Profile
             with col_left:
                 st.markdown("### Original Profile")
-                with st.container():
-                    st.json(st.session_state.selected_profile)
+                with st.container(height=600):
+                    st.code(_profile_json_text(st.session_state.selected_profile), language="json")
             
             # Right column - Anonymized Profile
             with col_right:
                 st.markdown("### Anonymized Profile")
                 if st.session_state.anonymized_profile:
-                    with st.container():
-                        st.json(st.session_state.anonymized_profile)
+                    with st.container(height=600):
+                        st.code(_profile_json_text(st.session_state.anonymized_profile), language="json")
                 else:
-                    st.info("Click 'Anonymize Profile' button below to see the anonymized version")
+                    st.info("Click 'Anonymize All Profiles' button below to see the anonymized version")
             
             # Anonymize button - centered at the bottom
             st.markdown("<br>", unsafe_allow_html=True)
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                if st.button("Anonymize Profile", type="primary", use_container_width=True):
-                    with st.spinner("Processing with Enhanced Talent Profile Anonymizer..."):
-                        try:
-                            # Call the anonymize function with the selected profile
-                            anonymized = anonymize_profile_with_config(st.session_state.selected_profile)
-                            
-                            # Store the result
-                            st.session_state.anonymized_profile = anonymized
-                            
-                            # Show success message
-                            st.success("Profile successfully anonymized using advanced bias detection!")
-                            
-                            # Rerun to update the display
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Error during anonymization: {str(e)}")
-                            st.info("Make sure all required packages are installed: presidio-analyzer, presidio-anonymizer, spacy")
+                # The callback runs before the rerun, so the anonymized
+                # profile above is already up to date when this returns True
+                if st.button(
+                    "Anonymize All Profiles",
+                    type="primary",
+                    use_container_width=True,
+                    on_click=_anonymize_all_profiles,
+                    args=(profiles_data,)
+                ):
+                    if st.session_state.anonymize_error:
+                        st.error(f"Error during anonymization: {st.session_state.anonymize_error}")
+                        st.info("Make sure all required packages are installed: presidio-analyzer, presidio-anonymizer, spacy")
+                    else:
+                        # Show success message
+                        st.success("Profiles successfully anonymized using advanced bias detection!")
             
             # Additional action buttons
             st.markdown("<br>", unsafe_allow_html=True)
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                if st.button("Reset", use_container_width=True):
-                    st.session_state.anonymized_profile = None
-                    st.rerun()
+                # Clearing the state in the callback avoids a second full run
+                st.button("Reset", use_container_width=True, on_click=_reset_anonymized_profiles)
             
             with col2:
                 if st.session_state.anonymized_profile:
-                    # Download button for anonymized profile
-                    anonymized_json = json.dumps(st.session_state.anonymized_profile, indent=2)
+                    # Download button for anonymized profile, reusing the
+                    # bytes serialized once for the panel above
                     st.download_button(
                         label="Download Anonymized Profile",
-                        data=anonymized_json,
+                        data=_profile_json_bytes(st.session_state.anonymized_profile),
                         file_name=f"anonymized_{selected_entry}.json",
                         mime="application/json",
                         use_container_width=True
@@ -560,43 +683,14 @@ def main():
             
             with col3:
                 if st.session_state.selected_profile and st.session_state.anonymized_profile:
-                    # Show analysis
-                    if st.button("Show Analysis", use_container_width=True):
-                        with st.expander("Anonymization Analysis", expanded=True):
-                            # Calculate statistics
-                            original_str = json.dumps(st.session_state.selected_profile)
-                            anonymized_str = json.dumps(st.session_state.anonymized_profile)
-                            
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("Original Size", f"{len(original_str)} chars")
-                            with col2:
-                                st.metric("Anonymized Size", f"{len(anonymized_str)} chars")
-                            with col3:
-                                reduction = len(original_str) - len(anonymized_str)
-                                st.metric("Reduction", f"{reduction} chars ({reduction/len(original_str)*100:.1f}%)")
-                            
-                            st.markdown("---")
-                            st.markdown("""
-                            **Processing Summary:**
-                            - Bias words removed from all configured sections
-                            - PII detection using Microsoft Presidio
-                            - Organization names replaced with generic placeholders
-                            - Nested structures automatically processed
-                            - Data integrity maintained throughout
-                            """)
+                    _analysis_section()
     else:
         st.warning("No profiles available. Please upload a JSON file with talent profiles.")
     
     # Footer
     st.markdown("<br><br>", unsafe_allow_html=True)
     st.markdown("---")
-    st.markdown("""
-        <div style='text-align: center; color: #666; padding: 10px;'>
-            <p>Powered by Microsoft Presidio and Enhanced Talent Profile Anonymizer</p>
-            <p>Ensuring fair and unbiased talent matching through advanced bias detection</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
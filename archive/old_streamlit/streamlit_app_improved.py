@@ -9,18 +9,30 @@ import sys
 from pathlib import Path
 import copy
 import re
+from functools import lru_cache
+from types import MappingProxyType
 
-# Add the src directory to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# pyahocorasick matches all bias words in one pass; fall back to the regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-# Try to import the anonymizer wrapper
+# The third-party regex module supports atomic groups and possessive
+# quantifiers, which stop the bias pattern backtracking on near-misses
 try:
-    from bias_anonymizer.anonymizer_wrapper import BiasAnonymizer
-    from bias_anonymizer.config_loader import create_anonymizer_from_config, create_custom_config_yaml
-    ANONYMIZER_AVAILABLE = True
-except ImportError as e:
-    ANONYMIZER_AVAILABLE = False
-    st.warning(f"Anonymizer not available, using basic version. Error: {e}")
+    import regex
+except ImportError:
+    regex = None
+
+# orjson is a much faster C implementation of the JSON paths; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Add the src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 # Page configuration
 st.set_page_config(
@@ -30,7 +42,7 @@ st.set_page_config(
 )
 
 # Custom CSS for clean white design
-st.markdown("""
+_CSS = """
     <style>
     /* Hide sidebar */
     [data-testid="stSidebar"] {
@@ -64,7 +76,16 @@ st.markdown("""
         border: 1px solid #ddd;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Header HTML
+_HEADER_HTML = """
+        <div class="profile-header">
+            <h1>Talent Profile Anonymizer</h1>
+            <p>Remove bias from Experience, Education, Qualification & Affiliation sections</p>
+        </div>
+    """
 
 
 # Define bias words for basic anonymization
@@ -94,31 +115,197 @@ BIAS_WORDS = [
 ]
 
 
+# All bias words (and their plurals) in one pattern, longest first so that
+# overlapping terms like "working-class" win over shorter ones
+_BIAS_ALTERNATION = '|'.join(map(re.escape, sorted(BIAS_WORDS, key=len, reverse=True)))
+_BIAS_RE = re.compile(r'\b(?:' + _BIAS_ALTERNATION + r')s?\b', re.IGNORECASE)
+
+# The regex module's word boundaries and case folding differ from re's on
+# some non-ASCII text (combining marks, superscript digits, dotless i), so
+# its pattern is only used for ASCII text, where the two agree
+if regex is not None:
+    # Committing to the longest word and its plural never loses a match here:
+    # every word that is a prefix of a longer one ("he", "her", "his")
+    # continues into it with a letter, so it can't end on a boundary there
+    _BIAS_ASCII_RE = regex.compile(r'\b(?>' + _BIAS_ALTERNATION + r')s?+\b', regex.IGNORECASE)
+else:
+    _BIAS_ASCII_RE = _BIAS_RE
+
+# The same words and plurals as an Aho-Corasick automaton, used instead of
+# _BIAS_RE when pyahocorasick is installed
+if ahocorasick is not None:
+    _BIAS_AUTOMATON = ahocorasick.Automaton()
+    for _word in BIAS_WORDS:
+        for _form in (_word, _word + 's'):
+            _BIAS_AUTOMATON.add_word(_form, len(_form))
+    _BIAS_AUTOMATON.make_automaton()
+else:
+    _BIAS_AUTOMATON = None
+
+
+# Without the automaton, short texts are first checked word by word against
+# a set (plurals included), which rules out most of them without running
+# _BIAS_RE. Terms with a space or dash span several words, so they are
+# searched for with a small pattern of their own.
+_BIAS_WORD_SET = frozenset(word for word in BIAS_WORDS if re.fullmatch(r'\w+', word))
+_BIAS_TOKEN_SET = _BIAS_WORD_SET | {word + 's' for word in _BIAS_WORD_SET}
+_BIAS_PHRASE_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(word) for word in BIAS_WORDS if word not in _BIAS_WORD_SET) + r')s?\b',
+    re.IGNORECASE
+)
+_WORD_RE = re.compile(r'\w+')
+_SHORT_TEXT_LENGTH = 128
+
+# Characters re.IGNORECASE treats as an ASCII letter although lower() doesn't
+# map them to it: dotted capital I, dotless i and long s
+_CASE_FOLD = str.maketrans('\u0130\u0131\u017f', 'iis')
+
+
+def _is_word_char(char):
+    """Mirror the regex \\w class so boundaries match _BIAS_RE."""
+    return char.isalnum() or char == '_'
+
+
+def _strip_bias_words(text):
+    """
+    Splice every bias word out of text, same as _BIAS_RE.sub('', text).
+    
+    Returns text itself when it contains no bias words.
+    """
+    lowered = text.translate(_CASE_FOLD).lower()
+    # Lowercasing can change the length of some non-ASCII text, which would
+    # misalign the match offsets
+    if _BIAS_AUTOMATON is None or len(lowered) != len(text):
+        # Lowercasing never changes whether a character is a word character,
+        # so the words of lowered line up with those of text
+        if (len(text) < _SHORT_TEXT_LENGTH
+                and _BIAS_TOKEN_SET.isdisjoint(_WORD_RE.findall(lowered))
+                and not _BIAS_PHRASE_RE.search(text)):
+            return text
+        pattern = _BIAS_ASCII_RE if text.isascii() else _BIAS_RE
+        result, count = pattern.subn('', text)
+        return result if count else text
+    
+    # Longest match starting at each position that sits on word boundaries
+    longest = {}
+    for end_index, length in _BIAS_AUTOMATON.iter(lowered):
+        start = end_index - length + 1
+        end = end_index + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        if end > longest.get(start, start):
+            longest[start] = end
+    
+    if not longest:
+        return text
+    
+    # Take matches left to right, skipping any that overlap the previous one
+    pieces = []
+    position = 0
+    for start in sorted(longest):
+        if start < position:
+            continue
+        pieces.append(text[position:start])
+        position = longest[start]
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+
 def basic_anonymize(text):
     """Basic anonymization function as fallback."""
     if not text or not isinstance(text, str):
         return text
     
-    result = text
-    for word in BIAS_WORDS:
-        pattern = r'\b' + re.escape(word) + r's?\b'
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+    # Repeated field values come from the cache; very long texts skip it so
+    # they can't bloat it
+    if len(text) > 2048:
+        return _basic_anonymize_text(text)
+    return _basic_anonymize_text_cached(text)
+
+
+def _basic_anonymize_text(text):
+    """Strip bias words from a non-empty string and tidy the whitespace."""
+    result = _strip_bias_words(text)
+    
+    # Fast path: no bias words and nothing to clean up. Printable text has no
+    # whitespace other than plain spaces, so it is already clean unless the
+    # spaces are doubled or at either end.
+    if (result is text and text.isprintable() and '  ' not in text
+            and text[0] != ' ' and text[-1] != ' '):
+        return text
     
-    # Clean up spaces
-    result = re.sub(r'\s+', ' ', result).strip()
+    # Clean up spaces: split() drops leading and trailing whitespace and
+    # collapses every run, all in C
+    result = ' '.join(result.split())
     return result if result else "[REDACTED]"
 
 
+_basic_anonymize_text_cached = lru_cache(maxsize=4096)(_basic_anonymize_text)
+
+
+# Operators and replacement tokens written into the temp config per strategy
+_BIAS_ENTITIES = (
+    'GENDER_BIAS', 'RACE_BIAS', 'AGE_BIAS', 'SOCIOECONOMIC_BIAS', 'DISABILITY_BIAS',
+    'RELIGION_BIAS', 'NATIONALITY_BIAS', 'MARITAL_STATUS_BIAS', 'DEFAULT'
+)
+_REDACT_OPERATORS = MappingProxyType(dict.fromkeys(_BIAS_ENTITIES, 'redact'))
+_REPLACE_OPERATORS = MappingProxyType(dict.fromkeys(_BIAS_ENTITIES, 'replace'))
+_REPLACEMENT_TOKENS = MappingProxyType({
+    'GENDER_BIAS': '[GENDER]',
+    'RACE_BIAS': '[RACE]',
+    'AGE_BIAS': '[AGE]',
+    'SOCIOECONOMIC_BIAS': '[BACKGROUND]',
+    'DISABILITY_BIAS': '[DISABILITY]',
+    'RELIGION_BIAS': '[RELIGION]',
+    'NATIONALITY_BIAS': '[NATIONALITY]',
+    'MARITAL_STATUS_BIAS': '[MARITAL_STATUS]',
+    'DEFAULT': '[REDACTED]'
+})
+
+
+@lru_cache(maxsize=None)
+def _load_default_config():
+    """Parse default_config.yaml once; callers must copy it before mutating."""
+    import yaml
+    
+    # The libyaml-backed loader is much faster when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    config_path = Path(__file__).parent / "config" / "default_config.yaml"
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=loader)
+
+
 def create_temp_config(strategy="redact"):
     """Create a temporary YAML config file for the selected strategy."""
+    import os
+    import tempfile
+    
+    # The file is checked on every call rather than cached, since temp
+    # directory cleanup may have removed it since the last one
+    config_yaml, path = _temp_config_yaml(strategy)
+    if not path.exists():
+        # Write beside the target and rename, so a concurrent reader never
+        # sees a partial file
+        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', dir=path.parent, delete=False)
+        with temp_file:
+            temp_file.write(config_yaml)
+        os.replace(temp_file.name, path)
+    
+    return str(path)
+
+
+@lru_cache(maxsize=None)
+def _temp_config_yaml(strategy):
+    """Build the YAML config for a strategy and the temp path it is kept at."""
+    import hashlib
     import yaml
     import tempfile
     
     # Load default config as base
     try:
-        config_path = Path(__file__).parent / "config" / "default_config.yaml"
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = copy.deepcopy(_load_default_config())
     except:
         # If default config not found, create minimal config
         config = {
@@ -152,49 +339,76 @@ def create_temp_config(strategy="redact"):
     # Update strategy
     config['anonymization_strategy'] = strategy
     
-    # Update operators based on strategy
+    # Update operators based on strategy; the dumper needs plain dicts
     if strategy == "redact":
-        config['operators'] = {
-            'GENDER_BIAS': 'redact',
-            'RACE_BIAS': 'redact',
-            'AGE_BIAS': 'redact',
-            'SOCIOECONOMIC_BIAS': 'redact',
-            'DISABILITY_BIAS': 'redact',
-            'RELIGION_BIAS': 'redact',
-            'NATIONALITY_BIAS': 'redact',
-            'MARITAL_STATUS_BIAS': 'redact',
-            'DEFAULT': 'redact'
-        }
+        config['operators'] = dict(_REDACT_OPERATORS)
     elif strategy == "replace":
-        config['operators'] = {
-            'GENDER_BIAS': 'replace',
-            'RACE_BIAS': 'replace',
-            'AGE_BIAS': 'replace',
-            'SOCIOECONOMIC_BIAS': 'replace',
-            'DISABILITY_BIAS': 'replace',
-            'RELIGION_BIAS': 'replace',
-            'NATIONALITY_BIAS': 'replace',
-            'MARITAL_STATUS_BIAS': 'replace',
-            'DEFAULT': 'replace'
-        }
-        config['replacement_tokens'] = {
-            'GENDER_BIAS': '[GENDER]',
-            'RACE_BIAS': '[RACE]',
-            'AGE_BIAS': '[AGE]',
-            'SOCIOECONOMIC_BIAS': '[BACKGROUND]',
-            'DISABILITY_BIAS': '[DISABILITY]',
-            'RELIGION_BIAS': '[RELIGION]',
-            'NATIONALITY_BIAS': '[NATIONALITY]',
-            'MARITAL_STATUS_BIAS': '[MARITAL_STATUS]',
-            'DEFAULT': '[REDACTED]'
-        }
+        config['operators'] = dict(_REPLACE_OPERATORS)
+        config['replacement_tokens'] = dict(_REPLACEMENT_TOKENS)
+    
+    # The temp path is named after the content, so repeat calls (and other
+    # sessions) reuse the file instead of leaving a new one each time
+    config_yaml = yaml.dump(config, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+    key = hashlib.sha1(config_yaml.encode()).hexdigest()[:12]
+    return config_yaml, Path(tempfile.gettempdir()) / f"bias_cfg_{strategy}_{key}.yaml"
+
+
+@st.cache_resource(show_spinner=False)
+def get_anonymizer(strategy="redact", use_yaml_config=True):
+    """
+    Build the anonymizer for a strategy and configuration mode.
+    
+    Construction loads the spaCy model, the Presidio recognizers and the YAML
+    config, so each instance is built once per process and shared across
+    reruns and sessions. The wrapper itself is imported here rather than at
+    the top of the script, so reruns that don't anonymize never import
+    Presidio and spaCy.
+    
+    Args:
+        strategy: The strategy to use (redact or replace)
+        use_yaml_config: If True, uses YAML configuration (Mode 1/2)
+                        If False, uses programmatic strategy (Mode 3)
+    
+    Raises:
+        ImportError: If the bias_anonymizer package isn't available
+    """
+    from bias_anonymizer.anonymizer_wrapper import BiasAnonymizer
     
-    # Create temp file
-    temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-    yaml.dump(config, temp_file)
-    temp_file.close()
+    if not use_yaml_config:
+        # MODE 3: Programmatic (minimal config)
+        return BiasAnonymizer(strategy=strategy)
     
-    return temp_file.name
+    # MODE 1/2: Use YAML configuration
+    if strategy == "redact":  # Assuming default is redact
+        try:
+            return BiasAnonymizer()  # Mode 1: Uses default_config.yaml
+        except:
+            # If default config not available, fall back to a temp config
+            pass
+    
+    # Strategy differs from default (or default config missing): temp config
+    temp_config = create_temp_config(strategy)
+    return BiasAnonymizer(config_path=temp_config)  # Mode 2
+
+
+# Profile sections the basic fallback removes bias from
+_SECTIONS_TO_PROCESS = ('experience', 'qualification', 'affiliation', 'education')
+
+
+def _loads_json(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, compact or with a 2-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
 
 
 def anonymize_profile(profile_data, strategy="redact", use_yaml_config=True):
@@ -207,58 +421,99 @@ def anonymize_profile(profile_data, strategy="redact", use_yaml_config=True):
         use_yaml_config: If True, uses YAML configuration (Mode 1/2)
                         If False, uses programmatic strategy (Mode 3)
     """
-    anonymized = copy.deepcopy(profile_data)
+    try:
+        anonymizer = get_anonymizer(strategy, use_yaml_config)
+        return anonymizer.anonymize(profile_data)
+        
+    except Exception as e:
+        _report_anonymizer_error(e)
     
-    if ANONYMIZER_AVAILABLE:
-        try:
-            if use_yaml_config:
-                # MODE 1/2: Use YAML configuration
-                # Try to use default config first
-                try:
-                    anonymizer = BiasAnonymizer()  # Mode 1: Uses default_config.yaml
-                    # If strategy differs from default, create temp config
-                    if strategy != "redact":  # Assuming default is redact
-                        temp_config = create_temp_config(strategy)
-                        anonymizer = BiasAnonymizer(config_path=temp_config)  # Mode 2
-                except:
-                    # If default config not available, create temp config
-                    temp_config = create_temp_config(strategy)
-                    anonymizer = BiasAnonymizer(config_path=temp_config)  # Mode 2
-            else:
-                # MODE 3: Programmatic (minimal config)
-                anonymizer = BiasAnonymizer(strategy=strategy)
-            
-            return anonymizer.anonymize(profile_data)
-            
-        except Exception as e:
-            st.error(f"Error using anonymizer: {e}")
-            st.info("Falling back to basic anonymization")
-    
-    # Basic anonymization fallback
-    sections_to_process = ['experience', 'qualification', 'affiliation', 'education']
-    
-    def process_value(obj, path=""):
+    return _basic_anonymize_profile(profile_data)
+
+
+def _report_anonymizer_error(error):
+    """Tell the user the anonymizer failed and the basic fallback is used."""
+    if isinstance(error, ImportError):
+        st.warning(f"Anonymizer not available, using basic version. Error: {error}")
+    else:
+        st.error(f"Error using anonymizer: {error}")
+        st.info("Falling back to basic anonymization")
+
+
+def _basic_anonymize_profile(profile_data):
+    """Basic anonymization fallback, used when the anonymizer fails."""
+    # The profile is rebuilt rather than copied and then modified: each
+    # container is built fresh and dropped into its slot in the new parent,
+    # while strings and other scalars are shared.
+    #
+    # Walk with an explicit stack. A section name can't span the dots in a
+    # path, so a field is in a section if its key or any ancestor's key names
+    # one; the flag carries that down instead of rechecking the whole path.
+    root = [None]
+    stack = [(profile_data, False, root, 0)]
+    while stack:
+        obj, in_section, parent, slot = stack.pop()
         if isinstance(obj, dict):
+            new_obj = {}
             for key, value in obj.items():
-                new_path = f"{path}.{key}" if path else key
-                if any(section in new_path.lower() for section in sections_to_process):
-                    if isinstance(value, str):
-                        obj[key] = basic_anonymize(value)
-                    elif isinstance(value, (dict, list)):
-                        process_value(value, new_path)
+                if in_section:
+                    key_in_section = True
+                else:
+                    key_lower = key.lower()
+                    key_in_section = any(section in key_lower for section in _SECTIONS_TO_PROCESS)
+                if isinstance(value, str):
+                    new_obj[key] = basic_anonymize(value) if key_in_section else value
                 elif isinstance(value, (dict, list)):
-                    process_value(value, new_path)
+                    # Reserve the key's position; the rebuilt value fills it
+                    new_obj[key] = None
+                    stack.append((value, key_in_section, new_obj, key))
+                else:
+                    new_obj[key] = value
         elif isinstance(obj, list):
-            for item in obj:
+            # Lists keep their parent's path; only nested containers are walked
+            new_obj = list(obj)
+            for index, item in enumerate(obj):
                 if isinstance(item, (dict, list)):
-                    process_value(item, path)
-                    
-    process_value(anonymized)
-    return anonymized
+                    stack.append((item, in_section, new_obj, index))
+        else:
+            new_obj = obj
+        parent[slot] = new_obj
+    
+    return root[0]
 
 
+def anonymize_profile_json(profile_json, strategy, use_yaml_config):
+    """
+    Anonymize a profile given as JSON bytes, cached across Streamlit reruns.
+    
+    Clicking again with the same profile, strategy and mode returns the
+    stored result instead of running the anonymizer again. Only the
+    anonymizer's results are cached; if it fails, the basic fallback is used
+    for this run and the anonymizer is tried again on the next one.
+    """
+    try:
+        return _cached_anonymize_profile(profile_json, strategy, use_yaml_config)
+    except Exception as e:
+        _report_anonymizer_error(e)
+    
+    return _basic_anonymize_profile(_loads_json(profile_json))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_anonymize_profile(profile_json, strategy, use_yaml_config):
+    """Run the anonymizer on a JSON profile; errors propagate so nothing is cached."""
+    anonymizer = get_anonymizer(strategy, use_yaml_config)
+    return anonymizer.anonymize(_loads_json(profile_json))
+
+
+@st.cache_resource(show_spinner=False)
 def get_sample_profiles():
-    """Get sample profiles for demonstration."""
+    """
+    Get sample profiles for demonstration.
+    
+    Streamlit re-executes this script on every rerun, so the profiles are
+    built once per process here and shared by reference; never mutate them.
+    """
     return {
         "Profile_001_John_Smith": {
             "userId": "USER_12345",
@@ -368,16 +623,12 @@ def main():
     # Initialize session state
     if 'anonymized_profile' not in st.session_state:
         st.session_state.anonymized_profile = None
+        st.session_state.anonymized_json = None
     if 'selected_profile' not in st.session_state:
         st.session_state.selected_profile = None
     
     # Header
-    st.markdown("""
-        <div class="profile-header">
-            <h1>Talent Profile Anonymizer</h1>
-            <p>Remove bias from Experience, Education, Qualification & Affiliation sections</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Get sample profiles
     profiles_data = get_sample_profiles()
@@ -454,12 +705,14 @@ def main():
                 try:
                     with st.spinner("Processing..."):
                         # Anonymize the profile with selected strategy and mode
-                        anonymized = anonymize_profile(
-                            st.session_state.selected_profile, 
-                            strategy=strategy,
-                            use_yaml_config=use_yaml
+                        anonymized = anonymize_profile_json(
+                            _dumps_json(st.session_state.selected_profile),
+                            strategy,
+                            use_yaml
                         )
                         st.session_state.anonymized_profile = anonymized
+                        # Serialize the download once, not on every rerun
+                        st.session_state.anonymized_json = _dumps_json(anonymized, indent=True)
                         
                         mode_text = "YAML configuration" if use_yaml else "programmatic mode"
                         st.success(f"Profile anonymized using '{strategy}' strategy with {mode_text}!")
@@ -475,14 +728,14 @@ def main():
         with col1:
             if st.button("Reset", use_container_width=True):
                 st.session_state.anonymized_profile = None
+                st.session_state.anonymized_json = None
                 st.rerun()
         
         with col2:
             if st.session_state.anonymized_profile:
-                anonymized_json = json.dumps(st.session_state.anonymized_profile, indent=2)
                 st.download_button(
                     label="Download Anonymized",
-                    data=anonymized_json,
+                    data=st.session_state.anonymized_json,
                     file_name=f"anonymized_{selected_entry}.json",
                     mime="application/json",
                     use_container_width=True
@@ -0,0 +1,99 @@
+"""
+Regression tests for the text helpers of the archived complete Streamlit app.
+
+The expected values are what stdlib re produces; the app must give the same
+output whichever of the optional regex engines (google-re2, regex) are
+installed.
+"""
+
+import importlib.util
+import os
+import re
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+APP_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'old_streamlit', 'streamlit_app_complete.py'
+)
+
+
+def _load_app():
+    """Import the app module from its path; old_streamlit is not a package."""
+    spec = importlib.util.spec_from_file_location("streamlit_app_complete", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+app = _load_app()
+
+
+class TestBiasRemovalNonAscii:
+    """Word boundaries and case folding on non-ASCII text."""
+
+    def test_accented_letters_are_part_of_the_word(self):
+        """'Zürich' is one word, so no bias word is cut out of it."""
+        assert app.remove_bias_from_text('Lives in Zürich, white male') == 'Lives in Zürich,'
+
+    def test_ligature_is_part_of_the_word(self):
+        """'man' is not a separate word inside 'manœuvre'."""
+        assert app.remove_bias_from_text('manœuvre expert') == 'manœuvre expert'
+
+    def test_superscript_digit_is_a_word_character(self):
+        """'male²' is one word, so 'male' is not removed from it."""
+        assert app.remove_bias_from_text('male² engineer') == 'male² engineer'
+
+    def test_dotless_i_matches_i(self):
+        """re.IGNORECASE folds dotless i, so 'junıor' is still a bias word."""
+        assert app.remove_bias_from_text('Senior junıor dev') == 'dev'
+
+    def test_vertical_tab_is_whitespace(self):
+        """Bias words next to a vertical tab are removed."""
+        assert app.remove_bias_from_text('Zürich\x0bwhite male') == 'Zürich'
+
+
+class TestPiiRemovalEngines:
+    """PII patterns match the same characters on every engine."""
+
+    def test_non_ascii_digits(self):
+        """\\d covers Arabic-Indic digits as well as ASCII ones."""
+        assert app.remove_pii_from_text('Tel ٤١٥-555-1234') == 'Tel [PHONE]'
+
+    def test_ascii_control_whitespace(self):
+        """\\s covers the \\x1c-\\x1f separators as well as spaces."""
+        assert app.remove_pii_from_text('Card 1234\x1c5678\x1c9012\x1c3456') == 'Card [CREDIT-CARD]'
+
+
+class TestPiiRemovalAdjacent:
+    """PII run together with other PII is redacted as by the patterns in order."""
+
+    def test_ssn_followed_by_phone(self):
+        """The SSN gets its word boundary once the phone number is replaced."""
+        assert app.remove_pii_from_text('SSN 123-45-6789415-555-1234') == 'SSN [SSN][PHONE]'
+
+    def test_passport_followed_by_phone(self):
+        """No digits of the phone number are left after the passport."""
+        assert app.remove_pii_from_text('ID AB123456415-555-1234') == 'ID [PASSPORT][PHONE]'
+
+    def test_passport_before_date(self):
+        """The phone pass runs first and takes the passport digits with the year."""
+        assert app.remove_pii_from_text('H1234567 2020-01-01') == 'H[PHONE]-01-01'
+    
+    @pytest.mark.parametrize('text', [
+        'H1234567 4111 1111 1111 1111Tel ',
+        'AB1234567890 and 10.0.0.1',
+        'SSN 123-45-6789 DOB 01/02/1990 bob@x.com',
+    ])
+    def test_same_as_patterns_in_order(self, text):
+        """Same output as applying each of PII_PATTERNS in turn with re."""
+        expected = text
+        for pii_type, pattern in app.PII_PATTERNS.items():
+            replacement = f"[{pii_type.upper().replace('_', '-')}]"
+            expected = re.sub(pattern, replacement, expected, flags=re.IGNORECASE)
+        assert app.remove_pii_from_text(text) == expected
+
+    def test_separate_phone_and_ssn(self):
+        """PII separated by other text is replaced in place."""
+        assert app.remove_pii_from_text('call 415-555-1234 or 123-45-6789') == 'call [PHONE] or [SSN]'
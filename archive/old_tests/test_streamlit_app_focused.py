@@ -0,0 +1,70 @@
+"""
+Regression tests for the batched text anonymization of the archived focused
+Streamlit app.
+
+Anonymizing many values in one batch must give the same output as
+anonymizing each value on its own.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+APP_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'old_streamlit', 'streamlit_app_focused.py'
+)
+
+
+def _load_app():
+    """Import the app module from its path; old_streamlit is not a package."""
+    spec = importlib.util.spec_from_file_location("streamlit_app_focused", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+app = _load_app()
+
+
+def _per_value(values, field_names, in_bias_sections):
+    """anonymize_text_field on each value separately."""
+    return [
+        app.anonymize_text_field(value, field_name, in_bias_section)
+        for value, field_name, in_bias_section in zip(values, field_names, in_bias_sections)
+    ]
+
+
+class TestBatchMatchesPerValue:
+    """anonymize_text_fields gives each value its own result."""
+
+    @pytest.mark.parametrize('values', [
+        ['Led team\nmale\x00', 'Senior engineer', 'Asian hire'],
+        ['Led team\nmale', '\x00Senior engineer', 'Asian hire'],
+        ['ß\nSenior\x00ß', 'young lead', 'married'],
+        ['see linkedin.com/in/bob', 'Senior engineer', '@bob and twitter.com/x'],
+    ])
+    def test_separator_like_values(self, values):
+        """Values holding newlines and NULs around bias words don't shift the batch."""
+        field_names = ['description'] * len(values)
+        in_bias_sections = [True] * len(values)
+        assert app.anonymize_text_fields(values, field_names, in_bias_sections) == \
+            _per_value(values, field_names, in_bias_sections)
+
+    def test_profile(self):
+        """The fields after a separator-like value keep their own results."""
+        result = app.anonymize_profile({'experience': {
+            'description': 'Led team\nmale\x00', 'notes': 'Senior engineer', 'summary': 'Asian hire'
+        }})
+        assert result['experience']['notes'] == 'engineer'
+        assert result['experience']['summary'] == 'hire'
+
+
+class TestPiiPasses:
+    """The PII patterns run one after another, as separate passes."""
+
+    def test_handle_next_to_link(self):
+        """A handle run into a link doesn't leave the rest of the link behind."""
+        assert app.remove_pii_patterns('@boblinkedin.com/x') == 'removed'
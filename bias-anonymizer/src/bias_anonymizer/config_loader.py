@@ -50,8 +50,21 @@ def create_anonymizer_from_config(config_path: Optional[str] = None) -> TalentPr
         Configured TalentProfileAnonymizer instance
     """
     yaml_config = load_config_from_yaml(config_path)
+    return create_anonymizer_from_dict(yaml_config)
+
+
+def create_anonymizer_from_dict(yaml_config: Dict[str, Any]) -> TalentProfileAnonymizer:
+    """
+    Create a TalentProfileAnonymizer from an already loaded configuration.
+    
+    Args:
+        yaml_config: Configuration dictionary in the default_config.yaml layout
     
-    # Extract all configuration from YAML
+    Returns:
+        Configured TalentProfileAnonymizer instance
+    """
+    # Extract all configuration from YAML, copying the mappings so the
+    # anonymizer never shares them with the caller's dict
     strategy = yaml_config.get('anonymization_strategy', 'redact')
     
     # Convert lists to sets for field configurations
@@ -59,13 +72,13 @@ def create_anonymizer_from_config(config_path: Optional[str] = None) -> TalentPr
     always_anonymize_fields = set(yaml_config.get('always_anonymize_fields', []))
     
     # Get special handling fields
-    special_handling_fields = yaml_config.get('special_handling_fields', {})
+    special_handling_fields = dict(yaml_config.get('special_handling_fields', {}))
     
     # Get replacement tokens
-    replacement_tokens = yaml_config.get('replacement_tokens', {})
+    replacement_tokens = dict(yaml_config.get('replacement_tokens', {}))
     
     # Get operators
-    operators = yaml_config.get('operators', {})
+    operators = dict(yaml_config.get('operators', {}))
     
     # Get detection settings
     detect_bias = yaml_config.get('detect_bias', True)
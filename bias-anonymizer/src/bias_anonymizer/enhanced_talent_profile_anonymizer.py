@@ -2,6 +2,7 @@
 Enhanced Talent Profile Anonymizer with automatic nested structure handling
 """
 
+import copy
 import json
 from typing import Dict, List, Optional, Any, Set, Union
 from dataclasses import dataclass, field
@@ -9,7 +10,7 @@ from enum import Enum
 
 from bias_anonymizer import JSONAnonymizer, AnonymizerConfig
 from bias_anonymizer.bias_words import BiasWords
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerRegistry
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
 
@@ -243,34 +244,88 @@ class EnhancedTalentProfileAnonymizer:
         
         # Cache for processed paths
         self._processed_paths = set()
+        
+        # Analyzer results computed up front by batch_analysis, keyed by text
+        self._batch_results = None
+        # Texts the analyzer would be asked about, while a dry run records them
+        self._recorded_texts = None
     
     def anonymize_talent_profile(self, 
                                  profile: Dict[str, Any],
-                                 custom_rules: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                                 custom_rules: Optional[Dict[str, str]] = None,
+                                 batch_analysis: bool = False) -> Dict[str, Any]:
         """
         Anonymize a talent profile with automatic nested structure handling.
         
         Args:
             profile: The talent profile JSON
             custom_rules: Optional custom rules for specific fields
+            batch_analysis: Analyze all the strings that need it in one
+                           BatchAnalyzerEngine pass (one spaCy nlp.pipe run)
+                           instead of one analyzer call per field. The result
+                           is the same.
             
         Returns:
             Anonymized talent profile
         """
-        import copy
+        custom_rules = custom_rules or {}
         anonymized = copy.deepcopy(profile)
         
-        # Reset processed paths cache
-        self._processed_paths = set()
-        
-        # Process the entire structure
-        self._process_structure(anonymized, "", custom_rules or {})
+        if batch_analysis:
+            self._batch_results = self._analyze_in_batch(profile, custom_rules)
+        try:
+            # Reset processed paths cache
+            self._processed_paths = set()
+            
+            # Process the entire structure
+            self._process_structure(anonymized, "", custom_rules)
+        finally:
+            self._batch_results = None
         
         # Clean empty structures
         self._clean_empty_structures(anonymized)
         
         return anonymized
     
+    def _analyze_in_batch(self,
+                          profile: Dict[str, Any],
+                          custom_rules: Dict[str, str]) -> Dict[str, List[Any]]:
+        """
+        Analyze, in one batch, every string processing profile will analyze.
+        
+        Which strings reach the analyzer depends only on the profile and the
+        rules, never on what the analyzer finds, so a dry run over a copy
+        that records the texts instead of analyzing them finds exactly those.
+        
+        Returns:
+            Analyzer results for each recorded text
+        """
+        self._recorded_texts = {}
+        try:
+            self._processed_paths = set()
+            self._process_structure(copy.deepcopy(profile), "", custom_rules)
+            texts = list(self._recorded_texts)
+        finally:
+            self._recorded_texts = None
+        
+        results = BatchAnalyzerEngine(self.analyzer).analyze_iterator(texts, language='en')
+        return dict(zip(texts, results))
+    
+    def _analyze(self, text: str) -> List[Any]:
+        """Analyze text, using the batch results when it was analyzed up front."""
+        if self._recorded_texts is not None:
+            # Dry run: note the text and report nothing found
+            self._recorded_texts[text] = None
+            return []
+        
+        if self._batch_results is not None:
+            results = self._batch_results.get(text)
+            if results is not None:
+                # Copies, since the anonymizer engine may adjust result offsets
+                return [copy.copy(result) for result in results]
+        
+        return self.analyzer.analyze(text=text, language='en')
+    
     def _register_bias_recognizers(self):
         """Register all our custom bias recognizers with Presidio."""
         from bias_anonymizer.bias_recognizers import (
@@ -568,7 +623,7 @@ class EnhancedTalentProfileAnonymizer:
             return False
         
         # Check if the value contains bias or PII
-        results = self.analyzer.analyze(text=value, language='en')
+        results = self._analyze(value)
         if len(results) > 0:
             return True
         
@@ -582,7 +637,10 @@ class EnhancedTalentProfileAnonymizer:
     def _anonymize_value(self, value: str, context: str) -> str:
         """Anonymize a string value using Presidio with our configuration."""
         # Analyze text with our custom recognizers
-        results = self.analyzer.analyze(text=value, language='en')
+        results = self._analyze(value)
+        if self._recorded_texts is not None:
+            # Dry run: the value itself is never used
+            return value
         
         # Anonymize with our configured operators (remove/replace)
         anonymized_result = self.anonymizer_engine.anonymize(
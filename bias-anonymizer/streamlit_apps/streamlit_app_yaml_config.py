@@ -9,8 +9,16 @@ import sys
 from pathlib import Path
 import copy
 import re
+from collections import deque
 import yaml
-import tempfile
+from functools import lru_cache
+from types import MappingProxyType
+
+# pyahocorasick matches all bias words in one pass; fall back to _BIAS_RE
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Add the src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -18,7 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 # Try to import the anonymizer wrapper
 try:
     from bias_anonymizer.anonymizer_wrapper import BiasAnonymizer
-    from bias_anonymizer.config_loader import create_anonymizer_from_config
+    from bias_anonymizer.config_loader import create_anonymizer_from_dict
     ANONYMIZER_AVAILABLE = True
 except ImportError as e:
     ANONYMIZER_AVAILABLE = False
@@ -96,35 +104,168 @@ BIAS_WORDS = [
 ]
 
 
+# All bias words (and their plurals) in one pattern, longest first so that
+# overlapping terms like "working-class" win over shorter ones
+_BIAS_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(BIAS_WORDS, key=len, reverse=True))) + r')s?\b',
+    re.IGNORECASE
+)
+
+# The same words and plurals as one Aho-Corasick automaton, so a text is
+# scanned once however many words there are
+if ahocorasick is not None:
+    _BIAS_AUTOMATON = ahocorasick.Automaton()
+    for _word in BIAS_WORDS:
+        for _form in (_word, _word + 's'):
+            _BIAS_AUTOMATON.add_word(_form, len(_form))
+    _BIAS_AUTOMATON.make_automaton()
+else:
+    _BIAS_AUTOMATON = None
+
+# Without the automaton, short texts are first checked word by word against
+# a set (plurals included), which rules out most of them without running
+# _BIAS_RE. Terms with a space or dash span several words, so they are
+# searched for with a small pattern of their own.
+_BIAS_WORD_SET = frozenset(word for word in BIAS_WORDS if re.fullmatch(r'\w+', word))
+_BIAS_TOKEN_SET = _BIAS_WORD_SET | {word + 's' for word in _BIAS_WORD_SET}
+_BIAS_PHRASE_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(word) for word in BIAS_WORDS if word not in _BIAS_WORD_SET) + r')s?\b',
+    re.IGNORECASE
+)
+_WORD_RE = re.compile(r'\w+')
+_SHORT_TEXT_LENGTH = 128
+
+# Characters re.IGNORECASE treats as an ASCII letter although lower() doesn't
+# map them to it: dotted capital I, dotless i and long s
+_CASE_FOLD = str.maketrans('\u0130\u0131\u017f', 'iis')
+
+
+def _is_word_char(char):
+    """Mirror the regex \\w class so boundaries match _BIAS_RE."""
+    return char.isalnum() or char == '_'
+
+
+def _strip_bias_words(text):
+    """
+    Splice every bias word out of text, same as _BIAS_RE.sub('', text).
+    
+    Returns text itself when it contains no bias words.
+    """
+    lowered = text.translate(_CASE_FOLD).lower()
+    # Lowercasing can change the length of some non-ASCII text, which would
+    # misalign the match offsets
+    if _BIAS_AUTOMATON is None or len(lowered) != len(text):
+        # Lowercasing never changes whether a character is a word character,
+        # so the words of lowered line up with those of text
+        if (len(text) < _SHORT_TEXT_LENGTH
+                and _BIAS_TOKEN_SET.isdisjoint(_WORD_RE.findall(lowered))
+                and not _BIAS_PHRASE_RE.search(text)):
+            return text
+        result, count = _BIAS_RE.subn('', text)
+        return result if count else text
+    
+    # Longest match starting at each position that sits on word boundaries
+    longest = {}
+    for end_index, length in _BIAS_AUTOMATON.iter(lowered):
+        start = end_index - length + 1
+        end = end_index + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        if end > longest.get(start, start):
+            longest[start] = end
+    
+    if not longest:
+        return text
+    
+    # Take matches left to right, skipping any that overlap the previous one
+    pieces = []
+    position = 0
+    for start in sorted(longest):
+        if start < position:
+            continue
+        pieces.append(text[position:start])
+        position = longest[start]
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+
 def basic_anonymize(text):
     """Basic anonymization function as fallback."""
     if not text or not isinstance(text, str):
         return text
     
-    result = text
-    for word in BIAS_WORDS:
-        pattern = r'\b' + re.escape(word) + r's?\b'
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+    return _clean_spaces(text, _strip_bias_words(text))
+
+
+def _clean_spaces(text, result):
+    """Tidy the whitespace of result, the bias-stripped form of text."""
+    # Fast path: no bias words and nothing to clean up. Printable text has no
+    # whitespace other than plain spaces, so it is already clean unless the
+    # spaces are doubled or at either end.
+    if (result == text and text.isprintable() and '  ' not in text
+            and text[0] != ' ' and text[-1] != ' '):
+        return text
     
-    # Clean up spaces
-    result = re.sub(r'\s+', ' ', result).strip()
+    # Clean up spaces: split() drops leading and trailing whitespace and
+    # collapses every run, all in C
+    result = ' '.join(result.split())
     return result if result else "[REDACTED]"
 
 
+# Joins field values so their bias words are stripped in one pass. It is not
+# a word character and no bias word contains it, so matching at it works the
+# same as at either end of a value.
+_FIELD_SEPARATOR = '\x1f'
+
+
+def _basic_anonymize_many(texts):
+    """basic_anonymize a list of non-empty strings with a single strip pass."""
+    if any(_FIELD_SEPARATOR in text for text in texts):
+        return [basic_anonymize(text) for text in texts]
+    
+    stripped = _strip_bias_words(_FIELD_SEPARATOR.join(texts)).split(_FIELD_SEPARATOR)
+    return [_clean_spaces(text, result) for text, result in zip(texts, stripped)]
+
+
+# Replacement tokens added for the bias entities under the "replace" strategy
+_BIAS_TOKENS = MappingProxyType({
+    'GENDER_BIAS': '[GENDER]',
+    'RACE_BIAS': '[RACE]',
+    'AGE_BIAS': '[AGE]',
+    'SOCIOECONOMIC_BIAS': '[BACKGROUND]',
+    'DISABILITY_BIAS': '[DISABILITY]',
+    'RELIGION_BIAS': '[RELIGION]',
+    'NATIONALITY_BIAS': '[NATIONALITY]',
+    'MARITAL_STATUS_BIAS': '[MARITAL_STATUS]',
+    'SEXUAL_ORIENTATION_BIAS': '[ORIENTATION]',
+    'POLITICAL_AFFILIATION_BIAS': '[POLITICAL]',
+    'FAMILY_STATUS_BIAS': '[FAMILY]',
+    'EDUCATION_BIAS': '[EDUCATION]'
+})
+
+
+@lru_cache(maxsize=1)
+def _load_base_config():
+    """Parse default_config.yaml once; callers must copy it before mutating."""
+    config_path = Path(__file__).parent / "config" / "default_config.yaml"
+    # The libyaml-backed loader is much faster when PyYAML was built with it
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
 @st.cache_resource
 def get_anonymizer_for_strategy(strategy="redact"):
     """
     Get anonymizer configured for the specified strategy.
-    Creates a temporary YAML config with the desired strategy.
+    Builds it from the default YAML config with the desired strategy.
     """
     # Load default config as base
-    config_path = Path(__file__).parent / "config" / "default_config.yaml"
-    
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-    except FileNotFoundError:
-        st.error(f"default_config.yaml not found at {config_path}")
+        config = copy.deepcopy(_load_base_config())
+    except FileNotFoundError as e:
+        st.error(f"default_config.yaml not found at {e.filename}")
         # Create minimal config
         config = {
             'anonymization_strategy': strategy,
@@ -163,77 +304,89 @@ def get_anonymizer_for_strategy(strategy="redact"):
             config['replacement_tokens'] = {}
         
         # Add tokens for bias types if not present
-        bias_tokens = {
-            'GENDER_BIAS': '[GENDER]',
-            'RACE_BIAS': '[RACE]',
-            'AGE_BIAS': '[AGE]',
-            'SOCIOECONOMIC_BIAS': '[BACKGROUND]',
-            'DISABILITY_BIAS': '[DISABILITY]',
-            'RELIGION_BIAS': '[RELIGION]',
-            'NATIONALITY_BIAS': '[NATIONALITY]',
-            'MARITAL_STATUS_BIAS': '[MARITAL_STATUS]',
-            'SEXUAL_ORIENTATION_BIAS': '[ORIENTATION]',
-            'POLITICAL_AFFILIATION_BIAS': '[POLITICAL]',
-            'FAMILY_STATUS_BIAS': '[FAMILY]',
-            'EDUCATION_BIAS': '[EDUCATION]'
-        }
-        config['replacement_tokens'].update(bias_tokens)
+        config['replacement_tokens'].update(_BIAS_TOKENS)
     
-    # Create temporary config file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f)
-        temp_config_path = f.name
-    
-    # Create anonymizer from the config
-    try:
-        return create_anonymizer_from_config(temp_config_path)
-    finally:
-        # Clean up temp file
-        Path(temp_config_path).unlink(missing_ok=True)
+    # Create anonymizer straight from the config, without a temp file
+    return create_anonymizer_from_dict(config)
+
+
+# Top-level sections whose fields the basic fallback anonymizes. Keys are
+# matched lowercased, so the names must be lowercase too; one pattern finds
+# any of them in a single search.
+_SECTIONS_TO_PROCESS = ('experience', 'qualification', 'affiliation', 'education', 'workEligibility')
+_SECTION_RE = re.compile('|'.join(section.lower() for section in _SECTIONS_TO_PROCESS))
 
 
 def anonymize_profile(profile_data, strategy="redact"):
     """
     Anonymize profile using Mode 1: YAML configuration.
+    
+    Results are cached, so anonymizing the same profile with the same
+    strategy again on a later rerun doesn't redo the work. Only the
+    anonymizer's results are cached; if it fails, the basic fallback is used
+    for this run and the anonymizer is tried again on the next one.
     """
+    profile_json = json.dumps(profile_data)
     if ANONYMIZER_AVAILABLE:
         try:
             # MODE 1: Use YAML configuration with the selected strategy
-            anonymizer = get_anonymizer_for_strategy(strategy)
-            return anonymizer.anonymize_talent_profile(profile_data)
+            return _anonymize_cached(profile_json, strategy)
             
         except Exception as e:
             st.error(f"Error using anonymizer: {e}")
             st.info("Falling back to basic anonymization")
     
-    # Basic anonymization fallback
-    anonymized = copy.deepcopy(profile_data)
-    sections_to_process = ['experience', 'qualification', 'affiliation', 'education', 'workEligibility']
-    
-    def process_value(obj, path=""):
+    # Parsing the JSON again gives the fallback a private copy to edit
+    return _basic_anonymize_profile(json.loads(profile_json))
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _anonymize_cached(profile_json, strategy):
+    """Anonymize a profile given as a JSON string; errors propagate uncached."""
+    anonymizer = get_anonymizer_for_strategy(strategy)
+    return anonymizer.anonymize_talent_profile(json.loads(profile_json))
+
+
+def _basic_anonymize_profile(anonymized):
+    """Basic anonymization fallback; edits the profile in place and returns it."""
+    # Walk the copy with an explicit stack instead of recursing. Section names
+    # contain no dots, so the dotted path contains one exactly when some key
+    # along it does; each frame carries that as a flag instead of the path.
+    # Fields to anonymize are collected as (container, key or index, value)
+    # and stripped together once the walk is done
+    stack = deque([(anonymized, False)])
+    targets = []
+    while stack:
+        obj, in_section = stack.pop()
         if isinstance(obj, dict):
             for key, value in obj.items():
-                new_path = f"{path}.{key}" if path else key
+                key_lower = key.lower()
+                key_in_section = in_section or _SECTION_RE.search(key_lower) is not None
                 # Check if we should process this field
                 should_process = (
-                    any(section in new_path.lower() for section in sections_to_process) or
-                    'description' in key.lower() or
-                    'title' in key.lower()
+                    key_in_section or
+                    'description' in key_lower or
+                    'title' in key_lower
                 )
                 if should_process and isinstance(value, str):
-                    obj[key] = basic_anonymize(value)
+                    if value:
+                        targets.append((obj, key, value))
                 elif isinstance(value, (dict, list)):
-                    process_value(value, new_path)
+                    stack.append((value, key_in_section))
         elif isinstance(obj, list):
-            for item in obj:
+            for idx, item in enumerate(obj):
                 if isinstance(item, (dict, list)):
-                    process_value(item, path)
+                    stack.append((item, in_section))
                 elif isinstance(item, str):
                     # Process string items in lists
-                    idx = obj.index(item)
-                    obj[idx] = basic_anonymize(item)
+                    if item:
+                        targets.append((obj, idx, item))
+    
+    if targets:
+        results = _basic_anonymize_many([value for _, _, value in targets])
+        for (container, slot, _), result in zip(targets, results):
+            container[slot] = result
     
-    process_value(anonymized)
     return anonymized
 
 
@@ -5,6 +5,7 @@ Test YAML-driven configuration system
 
 import sys
 import os
+import copy
 import json
 import yaml
 from pathlib import Path
@@ -14,8 +15,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from bias_anonymizer.config_loader import (
     create_anonymizer_from_config,
+    create_anonymizer_from_dict,
     create_custom_config_yaml,
     get_config_summary,
+    load_config_from_yaml,
     validate_config
 )
 from bias_anonymizer.anonymizer_wrapper import BiasAnonymizer
@@ -236,6 +239,38 @@ def test_field_list_from_yaml():
             Path(config_path).unlink()
 
 
+def test_anonymizer_from_dict():
+    """Test creating an anonymizer from an already loaded config dict."""
+    print("\n" + "="*60)
+    print("TEST 5: Anonymizer from Config Dict")
+    print("="*60)
+    
+    # Load the default config once, as the Streamlit app does
+    config = load_config_from_yaml()
+    original = copy.deepcopy(config)
+    
+    from_dict = create_anonymizer_from_dict(config)
+    from_path = create_anonymizer_from_config()
+    
+    # Same configuration as the path-based anonymizer
+    assert from_dict.profile_config == from_path.profile_config
+    print("\n✓ Configuration matches create_anonymizer_from_config()")
+    
+    # Same results
+    result_from_dict = from_dict.anonymize_talent_profile(test_profile)
+    result_from_path = from_path.anonymize_talent_profile(test_profile)
+    assert result_from_dict == result_from_path
+    print("✓ Anonymized profile matches create_anonymizer_from_config()")
+    
+    # The caller's dict is left untouched, and not shared with the anonymizer
+    assert config == original
+    assert from_dict.profile_config.replacement_tokens is not config.get('replacement_tokens')
+    assert from_dict.profile_config.operators is not config.get('operators')
+    print("✓ Config dict not modified")
+    
+    print(f"\n  businessTitle: {result_from_dict['core']['businessTitle']}")
+
+
 if __name__ == "__main__":
     print("YAML-DRIVEN CONFIGURATION TEST")
     print("Testing that all configuration comes from YAML files")
@@ -245,6 +280,7 @@ if __name__ == "__main__":
         test_custom_yaml_config()
         test_wrapper_with_yaml()
         test_field_list_from_yaml()
+        test_anonymizer_from_dict()
         
         print("\n" + "="*60)
         print("✅ All YAML configuration tests passed!")